@@ -63,11 +63,11 @@ class DownloadClient:
         self.trace_configs = []
         if os.getenv("PYCHARM_HOSTED") is not None:
             async def on_request_start(session, trace_config_ctx, params):
-                await log(f"Starting download {params.method} request to {params.url}", 40)
+                log(f"Starting download {params.method} request to {params.url}", 40)
 
             async def on_request_end(session, trace_config_ctx, params):
-                await log(f"Finishing download {params.method} request to {params.url}", 40)
-                await log(f"Response status for {params.url}: {params.response.status}", 40)
+                log(f"Finishing download {params.method} request to {params.url}", 40)
+                log(f"Response status for {params.url}: {params.response.status}", 40)
 
             trace_config = aiohttp.TraceConfig()
             trace_config.on_request_start.append(on_request_start)
@@ -113,7 +113,7 @@ class DownloadClient:
                     await self.manager.progress_manager.download_progress.add_skipped()
                     return False
                 if not proceed:
-                    await log(f"Skipping {media_item.url} as it has already been downloaded", 10)
+                    log(f"Skipping {media_item.url} as it has already been downloaded", 10)
                     await self.manager.progress_manager.download_progress.add_previously_completed(False)
                     await self.mark_completed(media_item, domain)
                     return False
@@ -153,7 +153,7 @@ class DownloadClient:
     async def download_file(self, manager: Manager, domain: str, media_item: MediaItem) -> bool:
         """Starts a file"""
         if self.manager.config_manager.settings_data['Download_Options']['skip_download_mark_completed']:
-            await log(f"Download Skip {media_item.url} due to mark completed option", 10)
+            log(f"Download Skip {media_item.url} due to mark completed option", 10)
             await self.manager.progress_manager.download_progress.add_skipped()
             await self.mark_incomplete(media_item, domain)
             await self.mark_completed(media_item, domain)
@@ -205,7 +205,7 @@ class DownloadClient:
             if expected_size:
                 file_size_check = await self.check_filesize_limits(media_item)
                 if not file_size_check:
-                    await log(f"Download Skip {media_item.url} due to filesize restrictions", 10)
+                    log(f"Download Skip {media_item.url} due to filesize restrictions", 10)
                     proceed = False
                     skip = True
                     return proceed, skip
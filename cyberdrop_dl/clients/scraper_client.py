@@ -8,7 +8,7 @@ from functools import wraps
 from typing import TYPE_CHECKING, Dict, Optional
 
 from aiohttp import ClientSession
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from multidict import CIMultiDictProxy
 from yarl import URL
 
@@ -28,11 +28,8 @@ def limiter(func):
             await self._global_limiter.acquire()
             await domain_limiter.acquire()
 
-            async with aiohttp.ClientSession(headers=self._headers, raise_for_status=False,
-                                             cookie_jar=self.client_manager.cookies, timeout=self._timeouts,
-                                             trace_configs=self.trace_configs) as client:
-                kwargs['client_session'] = client
-                return await func(self, *args, **kwargs)
+            kwargs['client_session'] = await self.get_session()
+            return await func(self, *args, **kwargs)
     return wrapper
 
 
@@ -48,17 +45,35 @@ class ScraperClient:
         self.trace_configs = []
         if os.getenv("PYCHARM_HOSTED") is not None:
             async def on_request_start(session, trace_config_ctx, params):
-                await log(f"Starting scrape {params.method} request to {params.url}", 10)
+                log(f"Starting scrape {params.method} request to {params.url}", 10)
 
             async def on_request_end(session, trace_config_ctx, params):
-                await log(f"Finishing scrape {params.method} request to {params.url}", 10)
-                await log(f"Response status for {params.url}: {params.response.status}", 10)
+                log(f"Finishing scrape {params.method} request to {params.url}", 10)
+                log(f"Response status for {params.url}: {params.response.status}", 10)
 
             trace_config = aiohttp.TraceConfig()
             trace_config.on_request_start.append(on_request_start)
             trace_config.on_request_end.append(on_request_end)
             self.trace_configs.append(trace_config)
-            
+
+        self._session: Optional[ClientSession] = None
+
+    async def get_session(self) -> ClientSession:
+        """Returns the shared scrape session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=10, keepalive_timeout=75, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(headers=self._headers, raise_for_status=False,
+                                                  cookie_jar=self.client_manager.cookies, timeout=self._timeouts,
+                                                  trace_configs=self.trace_configs, connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the shared scrape session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
+
     @limiter
     async def flaresolverr(self, domain: str, url: URL, client_session: ClientSession) -> str:
         """Returns the resolved URL from the given URL"""
@@ -78,15 +93,15 @@ class ScraperClient:
             return json_obj.get("solution").get("response")
 
     @limiter
-    async def get_BS4(self, domain: str, url: URL, client_session: ClientSession) -> BeautifulSoup:
-        """Returns a BeautifulSoup object from the given URL"""
+    async def get_BS4(self, domain: str, url: URL, client_session: ClientSession, strainer: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Returns a BeautifulSoup object from the given URL, only parsing what the strainer matches if one is given"""
         async with client_session.get(url, headers=self._headers, ssl=self.client_manager.ssl_context,
                                       proxy=self.client_manager.proxy) as response:
             try:
                 await self.client_manager.check_http_status(response)
             except DDOSGuardFailure:
                 response_text = await self.flaresolverr(domain, url)
-                return BeautifulSoup(response_text, 'html.parser')
+                return BeautifulSoup(response_text, 'lxml', parse_only=strainer)
             content_type = response.headers.get('Content-Type')
             assert content_type is not None
             if not any(s in content_type.lower() for s in ("html", "text")):
@@ -96,7 +111,7 @@ class ScraperClient:
             except UnicodeDecodeError:
                 # Handle binary or non-UTF-8 encoded responses
                 text = await response.text(encoding='utf-8', errors='replace')
-            return BeautifulSoup(text, 'html.parser')
+            return BeautifulSoup(text, 'lxml', parse_only=strainer)
 
     @limiter
     async def get_BS4_with_referrer(
@@ -114,7 +129,7 @@ class ScraperClient:
                 await self.client_manager.check_http_status(response)
             except DDOSGuardFailure:
                 response_text = await self.flaresolverr(domain, url)
-                return BeautifulSoup(response_text, "html.parser")
+                return BeautifulSoup(response_text, "lxml")
             content_type = response.headers.get("Content-Type")
             assert content_type is not None
             if not any(s in content_type.lower() for s in ("html", "text")):
@@ -126,7 +141,7 @@ class ScraperClient:
             except UnicodeDecodeError:
                 # Handle binary or non-UTF-8 encoded responses
                 text = await response.text(encoding='utf-8', errors='replace')
-            return BeautifulSoup(text, "html.parser")
+            return BeautifulSoup(text, "lxml")
 
     @limiter
     async def get_BS4_and_return_URL(self, domain: str, url: URL, client_session: ClientSession) -> tuple[BeautifulSoup, URL]:
@@ -143,7 +158,7 @@ class ScraperClient:
             except UnicodeDecodeError:
                 # Handle binary or non-UTF-8 encoded responses
                 text = await response.text(encoding='utf-8', errors='replace')
-            return BeautifulSoup(text, 'html.parser'), URL(response.url)
+            return BeautifulSoup(text, 'lxml'), URL(response.url)
 
     @limiter
     async def get_json(self, domain: str, url: URL, params: Optional[Dict] = None, headers_inc: Optional[Dict] = None, client_session: ClientSession = None) -> Dict:
@@ -41,33 +41,33 @@ def retry(f):
                         if hasattr(e, "status"):
                             await self.manager.progress_manager.download_stats_progress.add_failure(e.status)
                             if hasattr(e, "message"):
-                                await log(f"Download Failed: {media_item.url} with status {e.status} and message {e.message}", 40)
+                                log(f"Download Failed: {media_item.url} with status {e.status} and message {e.message}", 40)
                                 await self.manager.log_manager.write_download_error_log(media_item.url, f" {e.status} - {e.message}")
                             else:
-                                await log(f"Download Failed: {media_item.url} with status {e.status}", 40)
+                                log(f"Download Failed: {media_item.url} with status {e.status}", 40)
                                 await self.manager.log_manager.write_download_error_log(media_item.url, f" {e.status}")
                         else:
                             await self.manager.progress_manager.download_stats_progress.add_failure("Unknown")
                             await self.manager.log_manager.write_download_error_log(media_item.url, " See Log for Details")
-                            await log(f"Download Failed: {media_item.url} with error {e}", 40)
+                            log(f"Download Failed: {media_item.url} with error {e}", 40)
                         await self.manager.progress_manager.download_progress.add_failed()
                         break
 
                 if hasattr(e, "status"):
                     if hasattr(e, "message"):
-                        await log(f"Download Failed: {media_item.url} with status {e.status} and message {e.message}", 40)
+                        log(f"Download Failed: {media_item.url} with status {e.status} and message {e.message}", 40)
                     else:
-                        await log(f"Download Failed: {media_item.url} with status {e.status}", 40)
+                        log(f"Download Failed: {media_item.url} with status {e.status}", 40)
                 else:
-                    await log(f"Download Failed: {media_item.url} with error {e}", 40)
-                await log(f"Download Retrying: {media_item.url} with attempt {media_item.current_attempt}", 20)
+                    log(f"Download Failed: {media_item.url} with error {e}", 40)
+                log(f"Download Retrying: {media_item.url} with attempt {media_item.current_attempt}", 20)
             
             except DDOSGuardFailure as e:
                 media_item = args[0]
                 await self.attempt_task_removal(media_item)
-                await log(f"Download Failed: {media_item.url} with error {e}", 40)
+                log(f"Download Failed: {media_item.url} with error {e}", 40)
                 await self.manager.log_manager.write_download_error_log(media_item.url, " DDOSGuard")
-                await log(traceback.format_exc(), 40)
+                log(traceback.format_exc(), 40)
                 await self.manager.progress_manager.download_stats_progress.add_failure("DDOSGuard")
                 await self.manager.progress_manager.download_progress.add_failed()
                 break
@@ -75,18 +75,18 @@ def retry(f):
             except InvalidContentTypeFailure as e:
                 media_item = args[0]
                 await self.attempt_task_removal(media_item)
-                await log(f"Download Failed: {media_item.url} received Invalid Content", 40)
+                log(f"Download Failed: {media_item.url} received Invalid Content", 40)
                 await self.manager.log_manager.write_download_error_log(media_item.url, "Invalid Content Received")
-                await log(e.message, 40)
+                log(e.message, 40)
                 await self.manager.progress_manager.download_stats_progress.add_failure("Invalid Content Type")
                 await self.manager.progress_manager.download_progress.add_failed()
                 break
             
             except Exception as e:
                 media_item = args[0]
-                await log(f"Download Failed: {media_item.url} with error {e}", 40)
+                log(f"Download Failed: {media_item.url} with error {e}", 40)
                 await self.attempt_task_removal(media_item)
-                await log(traceback.format_exc(), 40)
+                log(traceback.format_exc(), 40)
                 await self.manager.log_manager.write_download_error_log(media_item.url, " See Log For Details")
                 await self.manager.progress_manager.download_stats_progress.add_failure("Unknown")
                 await self.manager.progress_manager.download_progress.add_failed()
@@ -130,7 +130,7 @@ class Downloader:
             self.processed_items.append(media_item.url.path)
             await self.manager.progress_manager.download_progress.update_total()
 
-            await log(f"Download Starting: {media_item.url}", 20)
+            log(f"Download Starting: {media_item.url}", 20)
             async with self.manager.client_manager.download_session_limit:
                 try:
                     if isinstance(media_item.file_lock_reference_name, Field):
@@ -139,12 +139,12 @@ class Downloader:
                     
                     await self.download(media_item)
                 except Exception as e:
-                    await log(f"Download Failed: {media_item.url} with error {e}", 40)
-                    await log(traceback.format_exc(), 40)
+                    log(f"Download Failed: {media_item.url} with error {e}", 40)
+                    log(traceback.format_exc(), 40)
                     await self.manager.progress_manager.download_stats_progress.add_failure("Unknown")
                     await self.manager.progress_manager.download_progress.add_failed()
                 else:
-                    await log(f"Download Finished: {media_item.url}", 20)
+                    log(f"Download Finished: {media_item.url}", 20)
                 finally:
                     await self._file_lock.release_lock(media_item.file_lock_reference_name)
         self._semaphore.release()
@@ -154,10 +154,10 @@ class Downloader:
     async def check_file_can_download(self, media_item: MediaItem) -> bool:
         """Checks if the file can be downloaded"""
         if not await self.manager.download_manager.check_free_space():
-            await log(f"Download Skip {media_item.url} due to insufficient free space", 10)
+            log(f"Download Skip {media_item.url} due to insufficient free space", 10)
             return False
         if not await self.manager.download_manager.check_allowed_filetype(media_item):
-            await log(f"Download Skip {media_item.url} due to filetype restrictions", 10)
+            log(f"Download Skip {media_item.url} due to filetype restrictions", 10)
             return False
         return True
 
@@ -221,10 +221,10 @@ class Downloader:
                     if hasattr(e, "message"):
                         if not e.message:
                             e.message = "Download Failed"
-                        await log(f"Download failed: {media_item.url} with status {e.status} and message {e.message}", 40)
+                        log(f"Download failed: {media_item.url} with status {e.status} and message {e.message}", 40)
                         await self.manager.log_manager.write_download_error_log(media_item.url, f" {e.status} - {e.message}")
                     else:
-                        await log(f"Download Failed: {media_item.url} with status {e.status}", 40)
+                        log(f"Download Failed: {media_item.url} with status {e.status}", 40)
                         await self.manager.log_manager.write_download_error_log(media_item.url, f" {e.status}")
                     return
 
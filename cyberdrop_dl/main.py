@@ -2,16 +2,22 @@ import asyncio
 import contextlib
 import logging
 import os
+import queue
 import sys
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 
+from rich.console import Console
 from rich.live import Live
 
+if sys.platform != "win32":
+    import uvloop
+
 from cyberdrop_dl.managers.manager import Manager
 from cyberdrop_dl.scraper.scraper import ScrapeMapper
 from cyberdrop_dl.ui.ui import program_ui
 from cyberdrop_dl.utils.sorting import Sorter
-from cyberdrop_dl.utils.utilities import check_latest_pypi, log_with_color, check_partials_and_empty_folders, log, print_download_progress, print_file_progress
+from cyberdrop_dl.utils.utilities import BufferedFileHandler, check_latest_pypi, log_with_color, check_partials_and_empty_folders, log, print_download_progress, print_file_progress
 
 
 def startup() -> Manager:
@@ -53,6 +59,7 @@ async def director(manager: Manager) -> None:
     manager.log_manager.startup()
 
     logger_debug = logging.getLogger("cyberdrop_dl_debug")
+    debug_listener = None
     import cyberdrop_dl.utils.utilities
     if os.getenv("PYCHARM_HOSTED") is not None or manager.config_manager.settings_data['Runtime_Options']['log_level'] == -1:
         manager.config_manager.settings_data['Runtime_Options']['log_level'] = 10
@@ -61,103 +68,118 @@ async def director(manager: Manager) -> None:
     if cyberdrop_dl.utils.utilities.DEBUG_VAR:
         logger_debug.setLevel(manager.config_manager.settings_data['Runtime_Options']['log_level'])
         if os.getenv("PYCHARM_HOSTED") is not None:
-            file_handler_debug = logging.FileHandler("../cyberdrop_dl_debug.log", mode="w")
+            file_handler_debug = BufferedFileHandler("../cyberdrop_dl_debug.log", mode="w")
         else:
-            file_handler_debug = logging.FileHandler("./cyberdrop_dl_debug.log", mode="w")
+            file_handler_debug = BufferedFileHandler("./cyberdrop_dl_debug.log", mode="w")
         file_handler_debug.setLevel(manager.config_manager.settings_data['Runtime_Options']['log_level'])
         formatter = logging.Formatter("%(levelname)-8s : %(asctime)s : %(filename)s:%(lineno)d : %(message)s")
         file_handler_debug.setFormatter(formatter)
-        logger_debug.addHandler(file_handler_debug)
+        debug_queue = queue.Queue(-1)
+        logger_debug.addHandler(QueueHandler(debug_queue))
+        debug_listener = QueueListener(debug_queue, file_handler_debug, respect_handler_level=True)
+        debug_listener.start()
 
         # aiosqlite_log = logging.getLogger("aiosqlite")
         # aiosqlite_log.setLevel(manager.config_manager.settings_data['Runtime_Options']['log_level'])
         # aiosqlite_log.addHandler(file_handler_debug)
 
-    while True:
-        logger = logging.getLogger("cyberdrop_dl")
-        if manager.args_manager.all_configs:
-            if len(logger.handlers) > 0:
-                await log("Picking new config...", 20)
-
-            configs_to_run = list(set(configs) - set(configs_ran))
-            configs_to_run.sort()
-            manager.config_manager.change_config(configs_to_run[0])
-            configs_ran.append(configs_to_run[0])
-            if len(logger.handlers) > 0:
-                await log(f"Changing config to {configs_to_run[0]}...", 20)
-                old_file_handler = logger.handlers[0]
-                logger.removeHandler(logger.handlers[0])
-                old_file_handler.close()
-
-        logger.setLevel(manager.config_manager.settings_data['Runtime_Options']['log_level'])
-        file_handler = logging.FileHandler(manager.path_manager.main_log, mode="w")
-        
-        if cyberdrop_dl.utils.utilities.DEBUG_VAR:
-            manager.config_manager.settings_data['Runtime_Options']['log_level'] = 10
-        file_handler.setLevel(manager.config_manager.settings_data['Runtime_Options']['log_level'])
+    # Log records are handed to a background thread so file writes never block the event loop
+    logger = logging.getLogger("cyberdrop_dl")
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    log_listener = None
 
-        formatter = logging.Formatter("%(levelname)-8s : %(asctime)s : %(filename)s:%(lineno)d : %(message)s")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-        await log("Starting Async Processes...", 20)
-        await manager.async_startup()
-
-        await log("Starting UI...", 20)
-        if not manager.args_manager.sort_all_configs:
-            try:
-                if not manager.args_manager.no_ui:
-                    with Live(manager.progress_manager.layout, refresh_per_second=manager.config_manager.global_settings_data['UI_Options']['refresh_rate']):
-                        await runtime(manager)
-                else:
-                    # Create a task to periodically print progress when using --no-ui
-                    await log_with_color("Running in no-ui mode with progress updates...", "cyan", 20)
-                    progress_task = asyncio.create_task(periodic_progress_updates(manager))
+    try:
+        while True:
+            if manager.args_manager.all_configs:
+                if log_listener:
+                    log("Picking new config...", 20)
+
+                configs_to_run = list(set(configs) - set(configs_ran))
+                configs_to_run.sort()
+                manager.config_manager.change_config(configs_to_run[0])
+                configs_ran.append(configs_to_run[0])
+                if log_listener:
+                    log(f"Changing config to {configs_to_run[0]}...", 20)
+                    log_listener.stop()
+                    log_listener.handlers[0].close()
+                    log_listener = None
+
+            logger.setLevel(manager.config_manager.settings_data['Runtime_Options']['log_level'])
+            file_handler = BufferedFileHandler(manager.path_manager.main_log, mode="w")
+        
+            if cyberdrop_dl.utils.utilities.DEBUG_VAR:
+                manager.config_manager.settings_data['Runtime_Options']['log_level'] = 10
+            file_handler.setLevel(manager.config_manager.settings_data['Runtime_Options']['log_level'])
+
+            formatter = logging.Formatter("%(levelname)-8s : %(asctime)s : %(filename)s:%(lineno)d : %(message)s")
+            file_handler.setFormatter(formatter)
+            log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            log_listener.start()
+
+            log("Starting Async Processes...", 20)
+            await manager.async_startup()
+
+            log("Starting UI...", 20)
+            if not manager.args_manager.sort_all_configs:
+                try:
+                    if not manager.args_manager.no_ui:
+                        with Live(manager.progress_manager.layout, refresh_per_second=manager.config_manager.global_settings_data['UI_Options']['refresh_rate']):
+                            await runtime(manager)
+                    else:
+                        # Create a task to periodically print progress when using --no-ui
+                        log_with_color("Running in no-ui mode with progress updates...", "cyan", 20)
+                        progress_task = asyncio.create_task(periodic_progress_updates(manager))
                     
-                    try:
-                        await runtime(manager)
-                    finally:
-                        progress_task.cancel()
-                        with contextlib.suppress(asyncio.CancelledError):
-                            await progress_task
-            except Exception as e:
-                print("\nAn error occurred, please report this to the developer")
-                print(e)
-                print(traceback.format_exc())
-                exit(1)
-
-        clear_screen_proc = await asyncio.create_subprocess_shell('cls' if os.name == 'nt' else 'clear')
-        await clear_screen_proc.wait()
-
-        await log_with_color(f"Running Post-Download Processes For Config: {manager.config_manager.loaded_config}...", "green", 20)
-        if isinstance(manager.args_manager.sort_downloads, bool):
-            if manager.args_manager.sort_downloads:
+                        try:
+                            await runtime(manager)
+                        finally:
+                            progress_task.cancel()
+                            with contextlib.suppress(asyncio.CancelledError):
+                                await progress_task
+                except Exception as e:
+                    print("\nAn error occurred, please report this to the developer")
+                    print(e)
+                    print(traceback.format_exc())
+                    exit(1)
+
+            Console().clear()
+
+            log_with_color(f"Running Post-Download Processes For Config: {manager.config_manager.loaded_config}...", "green", 20)
+            if isinstance(manager.args_manager.sort_downloads, bool):
+                if manager.args_manager.sort_downloads:
+                    sorter = Sorter(manager)
+                    await sorter.sort()
+            elif manager.config_manager.settings_data['Sorting']['sort_downloads'] and not manager.args_manager.retry:
                 sorter = Sorter(manager)
                 await sorter.sort()
-        elif manager.config_manager.settings_data['Sorting']['sort_downloads'] and not manager.args_manager.retry:
-            sorter = Sorter(manager)
-            await sorter.sort()
-        await check_partials_and_empty_folders(manager)
+            await check_partials_and_empty_folders(manager)
         
-        if manager.config_manager.settings_data['Runtime_Options']['update_last_forum_post']:
-            await log("Updating Last Forum Post...", 20)
-            await manager.log_manager.update_last_forum_post()
+            if manager.config_manager.settings_data['Runtime_Options']['update_last_forum_post']:
+                log("Updating Last Forum Post...", 20)
+                await manager.log_manager.update_last_forum_post()
             
-        await log("Printing Stats...", 20)
-        await manager.progress_manager.print_stats()
+            log("Printing Stats...", 20)
+            await manager.progress_manager.print_stats()
 
-        await log("Checking for Program End...", 20)
-        if not manager.args_manager.all_configs or not list(set(configs) - set(configs_ran)):
-            break
-        await asyncio.sleep(5)
+            log("Checking for Program End...", 20)
+            if not manager.args_manager.all_configs or not list(set(configs) - set(configs_ran)):
+                break
+            await asyncio.sleep(5)
 
-    await log("Checking for Updates...", 20)
-    await check_latest_pypi()
+        log("Checking for Updates...", 20)
+        await check_latest_pypi()
 
-    await log("Closing Program...", 20)
-    await manager.close()
+        log("Closing Program...", 20)
+        await manager.close()
 
-    await log_with_color("\nFinished downloading. Enjoy :)", 'green', 20)
+        log_with_color("\nFinished downloading. Enjoy :)", 'green', 20)
+    finally:
+        # Stopping drains the queues and closing flushes whatever the buffered handlers still hold
+        for listener in (log_listener, debug_listener):
+            if listener is not None:
+                listener.stop()
+                listener.handlers[0].close()
 
 
 async def periodic_progress_updates(manager: Manager) -> None:
@@ -168,27 +190,26 @@ async def periodic_progress_updates(manager: Manager) -> None:
     await asyncio.sleep(2)  # Initial delay to let scraping start
     
     while True:
-        # Print a separator line to distinguish between updates
-        await log_with_color("----------------------------------------", "white", 20)
-        await print_download_progress(manager)
-        await print_file_progress(manager)
+        printed = await print_download_progress(manager)
+        printed = await print_file_progress(manager) or printed
+        if printed:
+            # Print a separator line to distinguish between updates
+            log_with_color("----------------------------------------", "white", 20)
         await asyncio.sleep(update_interval)
 
 
 def main():
     manager = startup()
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    with contextlib.suppress(RuntimeError):
+    loop_factory = uvloop.new_event_loop if sys.platform != "win32" else None
+    with contextlib.suppress(RuntimeError), asyncio.Runner(loop_factory=loop_factory) as runner:
         try:
-            asyncio.run(director(manager))
+            runner.run(director(manager))
         except KeyboardInterrupt:
             print("\nTrying to Exit...")
             with contextlib.suppress(Exception):
-                asyncio.run(manager.close())
+                runner.run(manager.close())
             exit(1)
-    loop.close()
     sys.exit(0)
 
 
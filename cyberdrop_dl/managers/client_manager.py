@@ -69,6 +69,10 @@ class ClientManager:
             return self.domain_rate_limits[domain]
         return self.domain_rate_limits["other"]
 
+    async def close(self) -> None:
+        """Closes the shared client sessions"""
+        await self.scraper_session.close()
+
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
     async def check_http_status(self, response: ClientResponse, download: bool = False) -> None:
@@ -6,7 +6,7 @@ import shutil
 from base64 import b64encode
 from typing import TYPE_CHECKING
 
-from cyberdrop_dl.utils.utilities import FILE_FORMATS, log_debug
+from cyberdrop_dl.utils.utilities import FILE_FORMATS, MEDIA_FORMATS, log_debug
 
 if TYPE_CHECKING:
     from typing import Dict
@@ -23,21 +23,21 @@ class FileLock:
     async def check_lock(self, filename: str) -> None:
         """Checks if the file is locked"""
         try:
-            await log_debug(f"Checking lock for {filename}", 40)
+            log_debug("Checking lock for %s", 40, filename)
             await self._locked_files[filename].acquire()
-            await log_debug(f"Lock for {filename} acquired", 40)
+            log_debug("Lock for %s acquired", 40, filename)
         except KeyError:
-            await log_debug(f"Lock for {filename} does not exist", 40)
+            log_debug("Lock for %s does not exist", 40, filename)
             self._locked_files[filename] = asyncio.Lock()
             await self._locked_files[filename].acquire()
-            await log_debug(f"Lock for {filename} acquired", 40)
+            log_debug("Lock for %s acquired", 40, filename)
 
     async def release_lock(self, filename: str) -> None:
         """Releases the file lock"""
         with contextlib.suppress(KeyError, RuntimeError):
-            await log_debug(f"Releasing lock for {filename}", 40)
+            log_debug("Releasing lock for %s", 40, filename)
             self._locked_files[filename].release()
-            await log_debug(f"Lock for {filename} released", 40)
+            log_debug("Lock for %s released", 40, filename)
 
 
 class DownloadManager:
@@ -79,8 +79,6 @@ class DownloadManager:
             return False
         if media_item.ext in FILE_FORMATS['Audio'] and self.manager.config_manager.settings_data['Ignore_Options']['exclude_audio']:
             return False
-        if (self.manager.config_manager.settings_data['Ignore_Options']['exclude_other'] and
-              media_item.ext not in FILE_FORMATS['Images'] and media_item.ext not in FILE_FORMATS['Videos'] and
-              media_item.ext not in FILE_FORMATS['Audio']):
+        if self.manager.config_manager.settings_data['Ignore_Options']['exclude_other'] and media_item.ext not in MEDIA_FORMATS:
             return False
         return True
@@ -42,6 +42,9 @@ class Manager:
         
         self.vi_mode: bool = None
 
+        self.last_progress_state: tuple = ()
+        self.last_file_progress_state: tuple = ()
+
     def startup(self) -> None:
         """Startup process for the manager"""
         self.args_startup()
@@ -153,18 +156,20 @@ class Manager:
         input_file = str(self.path_manager.input_file)
         download_dir = str(self.path_manager.download_dir)
 
-        await log(f"Starting Cyberdrop-DL Process for {self.config_manager.loaded_config} Config", 10)
-        await log(f"Running version {__version__}", 10)
-        await log(f"Using Config: {self.config_manager.loaded_config}", 10)
-        await log(f"Using Config File: {str(self.config_manager.settings)}", 10)
-        await log(f"Using Input File: {input_file}", 10)
-        await log(f"Using Download Folder: {download_dir}", 10)
-        await log(f"Using History File: {str(self.path_manager.history_db)}", 10)
+        log(f"Starting Cyberdrop-DL Process for {self.config_manager.loaded_config} Config", 10)
+        log(f"Running version {__version__}", 10)
+        log(f"Using Config: {self.config_manager.loaded_config}", 10)
+        log(f"Using Config File: {str(self.config_manager.settings)}", 10)
+        log(f"Using Input File: {input_file}", 10)
+        log(f"Using Download Folder: {download_dir}", 10)
+        log(f"Using History File: {str(self.path_manager.history_db)}", 10)
 
-        await log(f"Using Authentication: \n{json.dumps(auth_provided, indent=4, sort_keys=True)}", 10)
-        await log(f"Using Settings: \n{json.dumps(print_settings, indent=4, sort_keys=True)}", 10)
-        await log(f"Using Global Settings: \n{json.dumps(self.config_manager.global_settings_data, indent=4, sort_keys=True)}", 10)
+        log(f"Using Authentication: \n{json.dumps(auth_provided, indent=4, sort_keys=True)}", 10)
+        log(f"Using Settings: \n{json.dumps(print_settings, indent=4, sort_keys=True)}", 10)
+        log(f"Using Global Settings: \n{json.dumps(self.config_manager.global_settings_data, indent=4, sort_keys=True)}", 10)
 
     async def close(self) -> None:
         """Closes the manager"""
+        if isinstance(self.client_manager, ClientManager):
+            await self.client_manager.close()
         await self.db_manager.close()
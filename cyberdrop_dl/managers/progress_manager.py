@@ -49,18 +49,18 @@ class ProgressManager:
 
     async def print_stats(self) -> None:
         """Prints the stats of the program"""
-        await log_with_color("\nDownload Stats:", "cyan", 20)
-        await log_with_color(f"Downloaded {self.download_progress.completed_files} files", "green", 20)
-        await log_with_color(f"Previously Downloaded {self.download_progress.previously_completed_files} files", "yellow", 20)
-        await log_with_color(f"Skipped By Config {self.download_progress.skipped_files} files", "yellow", 20)
-        await log_with_color(f"Failed {self.download_stats_progress.failed_files} files", "red", 20)
+        log_with_color("\nDownload Stats:", "cyan", 20)
+        log_with_color(f"Downloaded {self.download_progress.completed_files} files", "green", 20)
+        log_with_color(f"Previously Downloaded {self.download_progress.previously_completed_files} files", "yellow", 20)
+        log_with_color(f"Skipped By Config {self.download_progress.skipped_files} files", "yellow", 20)
+        log_with_color(f"Failed {self.download_stats_progress.failed_files} files", "red", 20)
 
         scrape_failures = await self.scrape_stats_progress.return_totals()
-        await log_with_color("\nScrape Failures:", "cyan", 20)
+        log_with_color("\nScrape Failures:", "cyan", 20)
         for key, value in scrape_failures.items():
-            await log_with_color(f"Scrape Failures ({key}): {value}", "red", 20)
+            log_with_color(f"Scrape Failures ({key}): {value}", "red", 20)
 
         download_failures = await self.download_stats_progress.return_totals()
-        await log_with_color("\nDownload Failures:", "cyan", 20)
+        log_with_color("\nDownload Failures:", "cyan", 20)
         for key, value in download_failures.items():
-            await log_with_color(f"Download Failures ({key}): {value}", "red", 20)
\ No newline at end of file
+            log_with_color(f"Download Failures ({key}): {value}", "red", 20)
\ No newline at end of file
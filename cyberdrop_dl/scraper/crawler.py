@@ -26,14 +26,14 @@ class Crawler(ABC):
         self.downloader = field(init=False)
         self.scraping_progress = manager.progress_manager.scraping_progress
         self.client: ScraperClient = field(init=False)
-        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(1)
 
         self.domain = domain
         self.folder_domain = folder_domain
 
         self.logged_in = field(init=False)
 
-        self.scraped_items: list = []
+        self.scraped_items: set = set()
         self.waiting_items = 0
 
     async def startup(self) -> None:
@@ -48,16 +48,15 @@ class Crawler(ABC):
             return
 
         self.waiting_items += 1
-        await self._lock.acquire()
-        self.waiting_items -= 1
-        if item.url.path_qs not in self.scraped_items:
-            await log(f"Scrape Starting: {item.url}", 20)
-            self.scraped_items.append(item.url.path_qs)
-            await self.fetch(item)
-            await log(f"Scrape Finished: {item.url}", 20)
-        else:
-            await log(f"Skipping {item.url} as it has already been scraped", 10)
-        self._lock.release()
+        async with self._semaphore:
+            self.waiting_items -= 1
+            if item.url.path_qs not in self.scraped_items:
+                log(f"Scrape Starting: {item.url}", 20)
+                self.scraped_items.add(item.url.path_qs)
+                await self.fetch(item)
+                log(f"Scrape Finished: {item.url}", 20)
+            else:
+                log(f"Skipping {item.url} as it has already been scraped", 10)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
@@ -69,11 +68,11 @@ class Crawler(ABC):
     async def handle_file(self, url: URL, scrape_item: ScrapeItem, filename: str, ext: str) -> None:
         """Finishes handling the file and hands it off to the downloader"""
         if self.domain in ['cyberdrop', 'bunkrr']:
-            original_filename, filename = await remove_id(self.manager, filename, ext)
+            original_filename, filename = remove_id(self.manager, filename, ext)
         else:
             original_filename = filename
 
-        download_folder = await get_download_path(self.manager, scrape_item, self.folder_domain)
+        download_folder = get_download_path(self.manager, scrape_item, self.folder_domain)
         media_item = MediaItem(url, scrape_item.url, scrape_item.album_id, download_folder, filename, ext, original_filename)
         if scrape_item.possible_datetime:
             media_item.datetime = scrape_item.possible_datetime
@@ -82,7 +81,7 @@ class Crawler(ABC):
         if check_complete:
             if media_item.album_id:
                 await self.manager.db_manager.history_table.set_album_id(self.domain, media_item)
-            await log(f"Skipping {url} as it has already been downloaded", 10)
+            log(f"Skipping {url} as it has already been downloaded", 10)
             await self.manager.progress_manager.download_progress.add_previously_completed()
             return
 
@@ -122,7 +121,7 @@ class Crawler(ABC):
             self.client.client_manager.cookies.update_cookies({"xf_user": session_cookie},
                                                               response_url=URL("https://" + login_url.host))
         if (not username or not password) and not session_cookie:
-            await log(f"Login wasn't provided for {login_url.host}", 30)
+            log(f"Login wasn't provided for {login_url.host}", 30)
             raise FailedLoginFailure(status=401, message="Login wasn't provided")
         attempt = 0
 
@@ -169,7 +168,7 @@ class Crawler(ABC):
         """Checks if the scrape item has already been scraped"""
         check_complete = await self.manager.db_manager.history_table.check_complete_by_referer(self.domain, scrape_item.url)
         if check_complete:
-            await log(f"Skipping {scrape_item.url} as it has already been downloaded", 10)
+            log(f"Skipping {scrape_item.url} as it has already been downloaded", 10)
             await self.manager.progress_manager.download_progress.add_previously_completed()
             return True
         return False
@@ -183,7 +182,7 @@ class Crawler(ABC):
         url_path = await get_db_path(url.with_query(""), self.domain)
         if album_results and url_path in album_results:
             if album_results[url_path] != 0:
-                await log(f"Skipping {url} as it has already been downloaded", 10)
+                log(f"Skipping {url} as it has already been downloaded", 10)
                 await self.manager.progress_manager.download_progress.add_previously_completed()
                 return True
         return False
@@ -1,27 +1,185 @@
 from __future__ import annotations
 
+import asyncio
 import calendar
-import datetime
 import re
+from functools import lru_cache, partial
+from string import digits
 from typing import TYPE_CHECKING, Tuple, Optional
 
+import soupsieve
+from soupsieve import SoupSieve
 from aiolimiter import AsyncLimiter
+from bs4 import BeautifulSoup, SoupStrainer
 from yarl import URL
 
 from cyberdrop_dl.clients.errors import NoExtensionFailure
 from cyberdrop_dl.scraper.crawler import Crawler
 from cyberdrop_dl.utils.dataclasses.url_objects import ScrapeItem
-from cyberdrop_dl.utils.utilities import FILE_FORMATS, get_filename_and_ext, error_handling_wrapper
+from cyberdrop_dl.utils.utilities import FILE_FORMATS, get_filename_and_ext, error_handling_wrapper, log, log_debug
 
 if TYPE_CHECKING:
     from cyberdrop_dl.managers.manager import Manager
 
+ALBUM_STRAINER = SoupStrainer(attrs={"class": re.compile(r"\b(?:theItem|truncate)\b")})
+VIDEO_PAGE_STRAINER = SoupStrainer(['a', 'video', 'title'])
+ALBUM_TITLE_SELECTOR = soupsieve.compile('h1.truncate')
+ALBUM_OG_TITLE_SELECTOR = soupsieve.compile('meta[property="og:title"]')
+ALBUM_CARD_SELECTOR = soupsieve.compile('div.relative.group\\/item.theItem')
+ALBUM_CARD_FALLBACK_SELECTOR = soupsieve.compile('div[class*="relative group/item theItem"]')
+CARD_DATE_CLASS_PATTERN = re.compile('theDate')
+VIDEO_DOWNLOAD_SELECTORS = tuple(map(soupsieve.compile, (
+    "a[class*=ic-download-01]",
+    "a[href*='get.bunkrr.su/file/']",
+    "a[class*='btn-main'][href*='get.bunkrr']",
+    "a[class*='download']",
+    "a[href*='.mp4']",
+)))
+VIDEO_DOWNLOAD_SELECTOR = soupsieve.compile(", ".join(selector.pattern for selector in VIDEO_DOWNLOAD_SELECTORS))
+OTHER_DOWNLOAD_SELECTORS = tuple(map(soupsieve.compile, (
+    'a[href*="get.bunkrr.su/file/"]',
+    'a[class*="btn-main"][href*="get.bunkrr"]',
+    'a[href*="get.bunkr"]',
+    'a[class*="download"]',
+    'a[download]',
+    'a[class*="btn-main"][href*="download"]',
+)))
+OTHER_DOWNLOAD_SELECTOR = soupsieve.compile(", ".join(selector.pattern for selector in OTHER_DOWNLOAD_SELECTORS))
+MAIN_IMAGE_SELECTOR = soupsieve.compile('figure img[src*="bunkr.ru"]:not(.blur):not([src$="thumbs/"])')
+FIGURE_IMAGE_SELECTOR = soupsieve.compile('figure img:not([src$="thumbs/"])')
+ENLARGE_LINK_SELECTOR = soupsieve.compile('a[href*="bunkr.ru"][href*=".webp"], a[href*="bunkr.ru"][href*=".jpg"], a[href*="bunkr.ru"][href*=".png"]')
+DOWNLOAD_ATTR_LINK_SELECTOR = soupsieve.compile('a[download*=""]')
+DOWNLOAD_CLASS_LINK_SELECTOR = soupsieve.compile('a[class*=download]')
+TEXT_SUBS_TITLE_SELECTOR = soupsieve.compile('h1.text-2xl.text-subs')
+SCRIPT_VIDEO_ATTRS = ('data-video', 'data-src', 'data-url', 'data-source', 'data-player')
+SCRIPT_VIDEO_SELECTOR = soupsieve.compile(", ".join(f"script[{attr}]" for attr in SCRIPT_VIDEO_ATTRS))
+SCRIPT_FILE_ID_SELECTOR = soupsieve.compile('script[data-file-id]')
+SCRIPT_DATA_T_MP4_SELECTOR = soupsieve.compile('script[data-t*=".mp4"]')
+GIGACHAD_MP4_PATTERNS = (
+    re.compile(r'(https?://[^"\']+\.cdn\.gigachad-cdn\.ru/[^"\']+?\.mp4)'),
+    re.compile(r'(https?://[^"\']+\.gigachad-cdn\.ru/[^"\']+?\.mp4)'),
+    re.compile(r'(https?://[^"\'\s]+gigachad-cdn[^"\'\s]+\.mp4)'),
+)
+SOURCE_MP4_PATTERNS = (
+    re.compile(r'<source\s+src="([^"]+?\.mp4)"'),
+    re.compile(r'<source\s+src=\'([^\']+?\.mp4)\''),
+    re.compile(r'<source\s+.*?src="([^"]+?\.mp4)"'),
+    re.compile(r'source\.src\s*=\s*["\']([^"\']+?\.mp4)["\']'),
+)
+DATA_MP4_PATTERNS = (
+    re.compile(r'data-src="([^"]+?\.mp4)"'),
+    re.compile(r'data-video="([^"]+?\.mp4)"'),
+    re.compile(r'data-url="([^"]+?\.mp4)"'),
+    re.compile(r'data-source="([^"]+?\.mp4)"'),
+)
+GET_FILE_HREF_PATTERN = re.compile(r'get\.bunkrr\.su/file/')
+RAW_MP4_PATTERN = re.compile(r'https?://[^"\'\s<>]+\.mp4')
+UUID_PATTERN = re.compile(r'([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})')
+THUMBS_ID_PATTERN = re.compile(r'/thumbs/([a-f0-9]{32})')
+SCRIPT_MP4_PATTERN = re.compile(r'<script\b[^>]*>(?:(?!</script>).)*?(https?://[^"\'<]+?\.mp4)', re.DOTALL)
+URL_HOST_PATTERN = re.compile(r'(?:https?:)?//(?:[^@/?#]*@)?([^:/?#]+)', re.IGNORECASE)
+
+TITLE_IMAGE_EXTENSIONS = (('.webp', '.webp'), ('.jpg', '.jpg'), ('.jpeg', '.jpg'), ('.png', '.png'), ('.gif', '.gif'))
+IMAGE_FORMATS = FILE_FORMATS['Images']
+VIDEO_FORMATS = FILE_FORMATS['Videos']
+
+REINFORCED_CACHE_SIZE = 4096
+
+STREAM_CDN_PREFIXES = (
+    "wiener", "i-wiener", "ramen", "i-ramen", "nachos", "i-nachos",
+    "wings", "i-wings", "pizza", "i-pizza", "burger", "i-burger",
+    "fries", "i-fries", "meatballs", "i-meatballs", "milkshake", "i-milkshake",
+    "kebab", "i-kebab", "taquito", "i-taquito", "soup", "i-soup",
+    "cdn-wiener", "cdn-ramen", "cdn-pizza", "cdn-burger", "cdn-meatballs",
+    "cdn-milkshake", "cdn-kebab", "cdn-taquito", "cdn-soup", "cdn-nachos",
+    "cdn-fries", "cdn-wings", "cdn", "c", "media-files",
+    "mlk-bk.cdn.gigachad-cdn", "brg-bk.cdn.gigachad-cdn",
+    "c1-st.cdn.gigachad-cdn", "f-c1.cdn.gigachad-cdn", "k1-cd.cdn.gigachad-cdn"
+)
+STREAM_CDN_HOSTS = frozenset(STREAM_CDN_PREFIXES)
+PAGE_HOST_PREFIXES = ("bunkr", "app.bunkr", "get.bunkr")
+
+VIDEO_CDN_DOMAINS = (
+    "nachos.bunkr.ru", "wings.bunkr.ru", "wiener.bunkr.ru",
+    "ramen.bunkr.ru", "pizza.bunkr.ru", "burger.bunkr.ru",
+    "fries.bunkr.ru", "meatballs.bunkr.ru", "milkshake.bunkr.ru",
+    "kebab.bunkr.ru", "taquito.bunkr.ru", "soup.bunkr.ru",
+    "mlk-bk.cdn.gigachad-cdn.ru", "brg-bk.cdn.gigachad-cdn.ru",
+    "c1-st.cdn.gigachad-cdn.ru", "f-c1.cdn.gigachad-cdn.ru",
+    "k1-cd.cdn.gigachad-cdn.ru"
+)
+
+
+def iter_by_priority(soup: BeautifulSoup, combined: SoupSieve, selectors: Tuple[SoupSieve, ...]):
+    """Yields the matches for each selector in order, walking the document only once with their combined selector"""
+    candidates = combined.select(soup)
+    for selector in selectors:
+        matches = [candidate for candidate in candidates if selector.match(candidate)]
+        if matches:
+            yield matches
+
+
+def select_by_priority(soup: BeautifulSoup, combined: SoupSieve, selectors: Tuple[SoupSieve, ...]) -> list:
+    """Returns the matches of the first selector that matches anything"""
+    return next(iter_by_priority(soup, combined, selectors), [])
+
+
+@lru_cache(maxsize=1024)
+def is_stream_cdn(domain_part: str) -> bool:
+    """Checks if the first label of a host is one of Bunkr's CDN servers, numbered or not"""
+    return domain_part.rstrip(digits) in STREAM_CDN_HOSTS or domain_part.split('-', 1)[0] in STREAM_CDN_HOSTS
+
+
+def cdn_domain_from_image(image_url: Optional[str]) -> Optional[str]:
+    """Returns the video CDN host that serves the file behind a Bunkr thumbnail or poster URL"""
+    # Only the host is needed, so match it out rather than running a full URL parse
+    match = URL_HOST_PATTERN.match(image_url) if image_url else None
+    if not match:
+        return None
+    host = match.group(1).lower()
+    if 'bunkr' not in host:
+        return None
+    return host[2:] if host.startswith('i-') else host
+
+
+def video_link_from_poster(poster: str, thumb_suffix: str) -> str:
+    """Rewrites a Bunkr poster thumbnail URL into the URL of the video it was taken from"""
+    # Only the path is rewritten, a query string or fragment is carried over untouched
+    path_end = min((i for i in (poster.find('?'), poster.find('#')) if i != -1), default=len(poster))
+    path, rest = poster[:path_end], poster[path_end:]
+    head, _, name = path.rpartition('/')
+    if head.endswith('/thumbs'):
+        head = head[:-len('/thumbs')]
+    if name.endswith(thumb_suffix):
+        name = name[:-len(thumb_suffix)] + '.mp4'
+    return f"{head}/{name}{rest}"
+
+
+def ext_from_title(title_lower: str) -> Optional[str]:
+    """Returns the image extension named in a lowercased Bunkr page title, if there is one"""
+    for token, ext in TITLE_IMAGE_EXTENSIONS:
+        if token in title_lower:
+            return ext
+    return None
+
+
+def find_video_source(soup: BeautifulSoup):
+    """Returns the source tag of the page's video player, if there is one"""
+    video = soup.find('video')
+    return video.find('source') if video else None
+
 
 class BunkrrCrawler(Crawler):
     def __init__(self, manager: Manager):
         super().__init__(manager, "bunkrr", "Bunkrr")
         self.primary_base_domain = URL("https://bunkr.sk")
-        self.request_limiter = AsyncLimiter(10, 1)
+        self.primary_base_origin = str(self.primary_base_domain)
+        self.primary_file_base = self.primary_base_domain / "d"
+        self.primary_video_base = self.primary_base_domain / "v"
+        self.request_limiter = AsyncLimiter(9.5, 1)
+        # Album items are independent pages, let several scrape at once and leave pacing to the limiter
+        self._semaphore = asyncio.Semaphore(10)
+        self.reinforced_links: dict[str, asyncio.Task] = {}
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
@@ -29,244 +187,155 @@ class BunkrrCrawler(Crawler):
         task_id = await self.scraping_progress.add_task(scrape_item.url)
         
         if not scrape_item.url:
-            print(f"[FETCH] Invalid URL: {scrape_item.url}")
-            print(f"Invalid URL: {scrape_item.url}")
+            log(f"Invalid URL: {scrape_item.url}", 30)
             await self.scraping_progress.remove_task(task_id)
             return
-            
-        scrape_item.url = await self.get_stream_link(scrape_item.url)
-        print(f"[FETCH] After get_stream_link: {scrape_item.url}")
 
-        if scrape_item.url.host and scrape_item.url.host.startswith("get"):
-            print("[FETCH] Host starts with 'get', calling reinforced_link")
+        # Direct CDN images are already the final media URL, skip the detour through their /d/ page
+        if self.is_direct_image(scrape_item.url):
+            await self.direct_image(scrape_item)
+            await self.scraping_progress.remove_task(task_id)
+            return
+            
+        # get. hosts are never stream links themselves, resolve them first and map the result once
+        host = scrape_item.url.host
+        if host and host.startswith("get"):
             scrape_item.url = await self.reinforced_link(scrape_item.url)
             if not scrape_item.url:
-                print("[FETCH] reinforced_link returned None")
                 await self.scraping_progress.remove_task(task_id)
                 return
-            scrape_item.url = await self.get_stream_link(scrape_item.url)
-            print(f"[FETCH] After second get_stream_link: {scrape_item.url}")
 
-        print(f"[FETCH] URL parts: {scrape_item.url.parts}")
-        if scrape_item.url.parts and len(scrape_item.url.parts) > 1:
-            if "a" in scrape_item.url.parts:
-                print("[FETCH] Directing to album handler")
-                await self.album(scrape_item)
-            elif "v" in scrape_item.url.parts:
-                print("[FETCH] Directing to video handler")
-                await self.video(scrape_item)
-            else:
-                print("[FETCH] Directing to other handler")
-                await self.other(scrape_item)
+        scrape_item.url = self.get_stream_link(scrape_item.url)
+
+        parts = scrape_item.url.parts
+        if len(parts) > 1:
+            # Normalize once here so every handler works against the primary domain
+            scrape_item.url = self.primary_base_domain.with_path(scrape_item.url.path)
+            handler = self.album if "a" in parts else self.video if "v" in parts else self.other
+            await handler(scrape_item)
         else:
-            print(f"[FETCH] URL has no parts: {scrape_item.url}")
-            print(f"URL has no parts: {scrape_item.url}")
+            log(f"URL has no parts: {scrape_item.url}", 30)
             
         await self.scraping_progress.remove_task(task_id)
 
     @error_handling_wrapper
     async def album(self, scrape_item: ScrapeItem) -> None:
-        print(f"[ALBUM] Processing album URL: {scrape_item.url}")
-        scrape_item.url = self.primary_base_domain.with_path(scrape_item.url.path)
-        print(f"[ALBUM] Modified URL to primary domain: {scrape_item.url}")
-        
         # Try to extract album ID from URL
         album_id = None
         if len(scrape_item.url.parts) > 2:
             album_id = scrape_item.url.parts[2]
-            print(f"[ALBUM] Extracted album ID from URL: {album_id}")
         
-        results = await self.get_album_results(album_id) if album_id else []
+        # One lookup for the whole album instead of a referer query per item page
+        completed_referers = await self.manager.db_manager.history_table.check_album_by_referer(self.domain, album_id) if album_id else set()
 
         async with self.request_limiter:
-            print(f"[ALBUM] Getting BS4 content for: {scrape_item.url}")
-            soup = await self.client.get_BS4(self.domain, scrape_item.url)
-            print("[ALBUM] Got BS4 content successfully")
+            text = await self.client.get_text(self.domain, scrape_item.url)
+
+        # Only the title and the item cards are needed, fall back to a full parse if the layout differs
+        soup = BeautifulSoup(text, 'lxml', parse_only=ALBUM_STRAINER)
+        if not ALBUM_TITLE_SELECTOR.select_one(soup):
+            soup = BeautifulSoup(text, 'lxml')
 
         # Extract album title
-        title_element = soup.select_one('h1.truncate') or soup.select_one('div.text-subs.font-semibold h1.truncate')
+        title_element = ALBUM_TITLE_SELECTOR.select_one(soup)
         if not title_element:
-            title_element = soup.select_one('meta[property="og:title"]')
+            title_element = ALBUM_OG_TITLE_SELECTOR.select_one(soup)
             title = title_element.get('content') if title_element else "Unknown Album"
         else:
             title = title_element.get_text().strip()
             
-        print(f"[ALBUM] Found album title: {title}")
         title = await self.create_title(title, album_id or "unknown", None)
         await scrape_item.add_to_parent_title(title)
-        print(f"[ALBUM] Created title: {title}")
 
         # Try different selectors for album items
-        card_listings = soup.select('div.relative.group\\/item.theItem')
+        card_listings = ALBUM_CARD_SELECTOR.select(soup)
         if not card_listings:
-            card_listings = soup.select('div[class*="relative group/item theItem"]')
+            card_listings = ALBUM_CARD_FALLBACK_SELECTOR.select(soup)
             
-        print(f"[ALBUM] Found {len(card_listings)} items in the album")
 
         for card_listing in card_listings:
             try:
-                print("[ALBUM] Processing an album item")
                 # Extract date
-                date_element = card_listing.select_one('span[class*="theDate"]')
-                date = await self.parse_datetime(date_element.text.strip()) if date_element else 0
-                print(f"[ALBUM] Extracted date: {date}")
+                date_element = card_listing.find('span', class_=CARD_DATE_CLASS_PATTERN)
+                date = self.parse_datetime(date_element.text.strip()) if date_element else 0
                 
                 # Get link directly
-                link_element = card_listing.select_one('a[href]')
+                link_element = card_listing.find('a', href=True)
                 if not link_element:
-                    print("[ALBUM] No link element found, skipping item")
                     continue
                     
                 link = link_element.get("href")
-                print(f"[ALBUM] Found link: {link}")
-                
-                if link.startswith("/"):
-                    link = URL("https://" + scrape_item.url.host + link)
-                    print(f"[ALBUM] Converted relative link to absolute: {link}")
-                else:
-                    link = URL(link)
-                
-                # Get the filename
-                filename_element = card_listing.select_one('p[class*="truncate theName"]')
-                if not filename_element:
-                    print("[ALBUM] No filename element found, trying alt methods")
-                    img = card_listing.select_one("img")
-                    if img and img.get("alt"):
-                        filename = img.get("alt")
-                    else:
-                        filename = link.parts[-1] if link.parts else "unknown"
-                else:
-                    filename = filename_element.text.strip()
-                    
-                print(f"[ALBUM] Extracted filename: {filename}")
                 
-                # Extract file extension
-                try:
-                    _, file_ext = await get_filename_and_ext(filename)
-                except NoExtensionFailure:
-                    print("[ALBUM] No extension in filename, trying to determine from context")
-                    if "Video" in card_listing.text or card_listing.select_one('span[class*="type-Video"]'):
-                        file_ext = ".mp4"
-                    elif "Image" in card_listing.text or card_listing.select_one('span[class*="type-Image"]'):
-                        file_ext = ".jpg"
-                    else:
-                        file_ext = ".mp4"  # Default to mp4
-                        
-                print(f"[ALBUM] Using file extension: {file_ext}")
+                link = scrape_item.url.join(URL(link))
 
+                if f"{self.primary_base_origin}{link.raw_path}" in completed_referers:
+                    log(f"Skipping {link} as it has already been downloaded", 10)
+                    await self.manager.progress_manager.download_progress.add_previously_completed()
+                    continue
+                
                 # Create a new scrape item to process the file link
                 new_scrape_item = await self.create_scrape_item(scrape_item, link, "", True, album_id, date)
-                print(f"[ALBUM] Created new scrape item for: {link}")
                 
-                # Check if this file should be skipped (was in previous results)
-                if results and await self.check_album_results(link, results):
-                    print(f"[ALBUM] Skipping previously processed link: {link}")
-                    continue
-                    
                 # Queue this file for processing
-                print(f"[ALBUM] Queuing file for processing: {link}")
                 self.manager.task_group.create_task(self.run(new_scrape_item))
                 
             except Exception as e:
-                print(f"[ALBUM] Error processing item: {str(e)}")
-                print(f"Error processing album item: {str(e)}")
+                log(f"Error processing album item: {str(e)}", 40)
                 continue
 
     @error_handling_wrapper
     async def video(self, scrape_item: ScrapeItem) -> None:
-        scrape_item.url = self.primary_base_domain.with_path(scrape_item.url.path)
         if await self.check_complete_from_referer(scrape_item):
             return
 
+        # The video page is only searched for download links, the player source and the title
         async with self.request_limiter:
-            soup = await self.client.get_BS4(self.domain, scrape_item.url)
+            soup = await self.client.get_BS4(self.domain, scrape_item.url, strainer=VIDEO_PAGE_STRAINER)
         
+        title_tag = soup.find('title')
         link_container = None
-        selectors = [
-            "a[class*=ic-download-01]",
-            "a[href*='get.bunkrr.su/file/']",
-            "a[class*='btn-main'][href*='get.bunkrr']",
-            "a[class*='download']",
-            "a[href*='.mp4']"
-        ]
-        
-        for selector in selectors:
-            links = soup.select(selector)
-            if links:
-                link_container = links[-1]
-                break
+        links = select_by_priority(soup, VIDEO_DOWNLOAD_SELECTOR, VIDEO_DOWNLOAD_SELECTORS)
+        if links:
+            link_container = links[-1]
                 
         if not link_container:
-            video_source = soup.select_one("video source")
+            video_source = find_video_source(soup)
             if video_source:
                 link = URL(video_source.get("src"))
                 try:
-                    filename, ext = await get_filename_and_ext(link.name)
+                    filename, ext = get_filename_and_ext(link.name)
                 except NoExtensionFailure:
-                    title_tag = soup.select_one("title")
-                    if title_tag:
-                        title_text = title_tag.text.strip()
-                        if "|" in title_text:
-                            possible_filename = title_text.split("|")[0].strip()
-                            if "." in possible_filename:
-                                try:
-                                    filename, ext = await get_filename_and_ext(possible_filename)
-                                    await self.handle_file(link, scrape_item, filename, ext)
-                                    return
-                                except NoExtensionFailure:
-                                    pass
-                    
-                    filename = scrape_item.url.parts[-1]
-                    ext = ".mp4"
+                    filename, ext = await self.filename_from_title(title_tag, scrape_item)
                 
                 await self.handle_file(link, scrape_item, filename, ext)
                 return
             else:
-                print(f"Could not find download link or video source for {scrape_item.url}")
+                log(f"Could not find download link or video source for {scrape_item.url}", 30)
                 return
 
         href = link_container.get('href')
         if not href:
-            print(f"Found link container but no href attribute for {scrape_item.url}")
-            title_tag = soup.select_one('title')
-            if title_tag and '.' in title_tag.text:
-                try:
-                    title_text = title_tag.text.strip()
-                    if '|' in title_text:
-                        possible_filename = title_text.split('|')[0].strip()
-                        filename, ext = await get_filename_and_ext(possible_filename)
-                    else:
-                        filename, ext = await get_filename_and_ext(title_text.strip())
-                    
-                    video_source = soup.select_one('video source')
-                    if video_source and video_source.get('src'):
-                        link = URL(video_source.get('src'))
-                        await self.handle_file(link, scrape_item, filename, ext)
-                        return
-                except NoExtensionFailure:
-                    pass
-            
-            video_source = soup.select_one('video source')
+            log(f"Found link container but no href attribute for {scrape_item.url}", 10)
+            video_source = find_video_source(soup)
             if video_source and video_source.get('src'):
                 link = URL(video_source.get('src'))
-                filename = scrape_item.url.parts[-1]
-                ext = ".mp4"
+                filename, ext = await self.filename_from_title(title_tag, scrape_item)
                 await self.handle_file(link, scrape_item, filename, ext)
                 return
             else:
-                print(f"Could not find any usable source for {scrape_item.url}")
+                log(f"Could not find any usable source for {scrape_item.url}", 30)
                 return
 
         link = URL(href)
 
         try:
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
         except NoExtensionFailure:
             try:
-                video_source = soup.select_one('video source')
+                video_source = find_video_source(soup)
                 if video_source:
                     src_url = URL(video_source.get('src'))
-                    filename, ext = await get_filename_and_ext(src_url.name)
+                    filename, ext = get_filename_and_ext(src_url.name)
                     link = src_url
                 else:
                     raise NoExtensionFailure()
@@ -275,149 +344,94 @@ class BunkrrCrawler(Crawler):
                     link = await self.reinforced_link(link)
                     if not link:
                         return
-                    filename, ext = await get_filename_and_ext(link.name)
+                    filename, ext = get_filename_and_ext(link.name)
                 else:
-                    title_tag = soup.select_one('title')
-                    if title_tag and '.' in title_tag.text:
-                        try:
-                            title_text = title_tag.text.strip()
-                            if '|' in title_text:
-                                possible_filename = title_text.split('|')[0].strip()
-                                filename, ext = await get_filename_and_ext(possible_filename)
-                            else:
-                                filename, ext = await get_filename_and_ext(title_text.strip())
-                        except NoExtensionFailure:
-                            filename = scrape_item.url.parts[-1]
-                            ext = ".mp4"
-                    else:
-                        filename = scrape_item.url.parts[-1]
-                        ext = ".mp4"
+                    filename, ext = await self.filename_from_title(title_tag, scrape_item)
 
         await self.handle_file(link, scrape_item, filename, ext)
 
     @error_handling_wrapper
     async def other(self, scrape_item: ScrapeItem) -> None:
-        print(f"[OTHER] Starting to process: {scrape_item.url}")
-        scrape_item.url = self.primary_base_domain.with_path(scrape_item.url.path)
-        print(f"[OTHER] Modified URL to primary domain: {scrape_item.url}")
-        
         if await self.check_complete_from_referer(scrape_item):
-            print("[OTHER] URL already completed from referrer")
             return
 
         filename = ""
         ext = ""
         
-        print("[OTHER] Getting BS4 from URL")
         async with self.request_limiter:
             soup = await self.client.get_BS4(self.domain, scrape_item.url)
-        print("[OTHER] BS4 retrieval successful")
 
         # First check if this is a video by examining the meta tags and title
         is_video = False
         
         # Check meta tag for video type
-        meta_type = soup.select_one('meta[property="og:type"]')
+        meta_type = soup.find('meta', property='og:type')
         if meta_type and meta_type.get('content') == 'video':
-            print("[OTHER] Detected video via meta og:type tag")
             is_video = True
         
         # Check for video in the title
-        title_tag = soup.select_one('title')
+        title_tag = soup.find('title')
         if title_tag:
             title_text = title_tag.text.strip().lower()
-            print(f"[OTHER] Found title: {title_text}")
             if '.mp4' in title_text or '.webm' in title_text or '.mov' in title_text:
-                print("[OTHER] Title indicates this is a video file")
                 is_video = True
         
         # Check for video elements on the page
-        video_element = soup.select_one('video')
+        video_element = soup.find('video')
         if video_element:
-            print("[OTHER] Found video element on page")
             is_video = True
         
         # Check for download button with video-like URL
-        download_link = soup.select_one('a[href*="get.bunkrr.su/file/"]')
+        download_link = soup.find('a', href=GET_FILE_HREF_PATTERN)
         if download_link:
-            print("[OTHER] Found download link to get.bunkrr.su")
             is_video = True
         
         if is_video:
-            print("[OTHER] Processing as video file")
             video_url, extracted_filename, extracted_ext = await self.extract_video_from_get_page(soup, scrape_item.url)
             
             if video_url:
-                print(f"[OTHER] Successfully extracted video URL: {video_url}")
                 if extracted_filename and extracted_ext:
                     filename = extracted_filename
                     ext = extracted_ext
-                    print(f"[OTHER] Using extracted filename: {filename}, ext: {ext}")
                 elif not filename or not ext:
                     try:
-                        filename, ext = await get_filename_and_ext(video_url.name)
-                        print(f"[OTHER] Got filename from video URL: {filename}, ext: {ext}")
+                        filename, ext = get_filename_and_ext(video_url.name)
                     except NoExtensionFailure:
-                        # Try to get from title
-                        if title_tag:
-                            title_text = title_tag.text.strip()
-                            if ".mp4" in title_text:
-                                parts = title_text.split("|")[0].strip() if "|" in title_text else title_text
-                                filename = parts
-                                ext = ".mp4"
-                            else:
-                                filename = scrape_item.url.parts[-1]
-                                ext = ".mp4"
-                        else:
-                            filename = scrape_item.url.parts[-1]
-                            ext = ".mp4"
-                        print(f"[OTHER] Using title or URL part: {filename} with ext: {ext}")
+                        filename, ext = await self.filename_from_title(title_tag, scrape_item)
                 
-                print(f"[OTHER] Calling handle_file with: link={video_url}, filename={filename}, ext={ext}")
                 await self.handle_file(video_url, scrape_item, filename, ext)
                 return
         
-        # If we get here, check if it's an image file
-        img_tags = soup.select('figure img[src*="bunkr.ru"]')
-        if img_tags:
-            print("[OTHER] Found image content")
-            # Use the main image (not the blurred background one)
-            for img in img_tags:
-                if 'blur' not in img.get('class', '') and not img.get('src', '').endswith('thumbs/'):
-                    image_url = URL(img.get('src'))
-                    print(f"[OTHER] Found direct image URL: {image_url}")
-                    
+        # If we get here, check if it's an image file, using the main image (not the blurred background one)
+        img = MAIN_IMAGE_SELECTOR.select_one(soup)
+        if img:
+            image_url = URL(img.get('src'))
+            
+            try:
+                filename, ext = get_filename_and_ext(image_url.name)
+            except NoExtensionFailure:
+                # Try to get filename from page title
+                title_tag = soup.find('h1')
+                if title_tag:
+                    title_text = title_tag.text.strip()
                     try:
-                        filename, ext = await get_filename_and_ext(image_url.name)
-                        print(f"[OTHER] Extracted filename from image URL: {filename}, ext: {ext}")
+                        filename, ext = get_filename_and_ext(title_text)
                     except NoExtensionFailure:
-                        # Try to get filename from page title
-                        title_tag = soup.select_one('h1')
-                        if title_tag:
-                            title_text = title_tag.text.strip()
-                            print(f"[OTHER] Using page title for filename: {title_text}")
-                            try:
-                                filename, ext = await get_filename_and_ext(title_text)
-                            except NoExtensionFailure:
-                                # If no extension in title, get it from URL
-                                filename = title_text
-                                ext = ".webp" if ".webp" in title_text else ".jpg"
-                                
-                print(f"[OTHER] Downloading image with filename: {filename}{ext}")
-                await self.handle_file(image_url, scrape_item, filename, ext)
-                return
+                        # If no extension in title, get it from URL
+                        filename = title_text
+                        ext = ".webp" if ".webp" in title_text else ".jpg"
+                        
+            await self.handle_file(image_url, scrape_item, filename, ext)
+            return
         
         # Check for meta image tags (often used for images)
-        meta_image = soup.select_one('meta[property="og:image"]')
+        meta_image = soup.find('meta', property='og:image')
         if meta_image and meta_image.get('content') and not is_video:
             # Only use meta image for actual images, not video thumbnails
             image_url_str = meta_image.get('content')
-            print(f"[OTHER] Found meta image: {image_url_str}")
             
             # Check if this is truly an image and not a video thumbnail
-            if 'thumbs' in image_url_str and is_video:
-                print("[OTHER] This appears to be a video thumbnail, not treating as image")
-            else:
+            if 'thumbs' not in image_url_str or not is_video:
                 # Convert thumbs URL to direct image URL if needed
                 if 'thumbs' in image_url_str:
                     image_url_str = image_url_str.replace('/thumbs/', '/')
@@ -426,12 +440,12 @@ class BunkrrCrawler(Crawler):
                         image_url_str = image_url_str[:-4]
                         
                     # Add correct extension based on page title if possible
-                    title_tag = soup.select_one('h1')
+                    title_tag = soup.find('h1')
                     if title_tag:
-                        title_text = title_tag.text.strip()
-                        if '.webp' in title_text.lower():
+                        title_lower = title_tag.text.strip().lower()
+                        if '.webp' in title_lower:
                             image_url_str += '.webp'
-                        elif '.jpg' in title_text.lower() or '.jpeg' in title_text.lower():
+                        elif '.jpg' in title_lower or '.jpeg' in title_lower:
                             image_url_str += '.jpg'
                         else:
                             image_url_str += '.webp'  # Default extension for image
@@ -439,167 +453,121 @@ class BunkrrCrawler(Crawler):
                         image_url_str += '.webp'  # Default extension
                 
                 image_url = URL(image_url_str)
-                print(f"[OTHER] Processed image URL: {image_url}")
                 
                 try:
-                    filename, ext = await get_filename_and_ext(image_url.name)
-                    print(f"[OTHER] Extracted filename from image URL: {filename}, ext: {ext}")
+                    filename, ext = get_filename_and_ext(image_url.name)
                 except NoExtensionFailure:
                     # Try to get filename from page title
-                    title_tag = soup.select_one('h1')
+                    title_tag = soup.find('h1')
                     if title_tag:
                         title_text = title_tag.text.strip()
-                        print(f"[OTHER] Using page title for filename: {title_text}")
                         try:
-                            filename, ext = await get_filename_and_ext(title_text)
+                            filename, ext = get_filename_and_ext(title_text)
                         except NoExtensionFailure:
                             # If no extension in title, get it from URL
                             filename = title_text
                             ext = ".webp"  # Default to webp
                 
-                print(f"[OTHER] Downloading image with filename: {filename}{ext}")
                 await self.handle_file(image_url, scrape_item, filename, ext)
                 return
 
         # If we're still here, look for download links for any file type
-        print("[OTHER] Looking for download link with specific selectors")
-        
-        download_selectors = [
-            'a[href*="get.bunkrr.su/file/"]',
-            'a[class*="btn-main"][href*="get.bunkrr"]',
-            'a[href*="get.bunkr"]',
-            'a[class*="download"]',
-            'a[download]',
-            'a[class*="btn-main"][href*="download"]'
-        ]
         
         link_container = None
-        for selector in download_selectors:
-            links = soup.select(selector)
-            if links:
-                for possible_link in links:
-                    href = possible_link.get('href')
-                    if href and not href.endswith('/upload') and not href.startswith('/upload'):
-                        link_container = possible_link
-                        print(f"[OTHER] Found download link with selector: {selector}")
-                        break
-                if link_container:
+        for links in iter_by_priority(soup, OTHER_DOWNLOAD_SELECTOR, OTHER_DOWNLOAD_SELECTORS):
+            for possible_link in links:
+                href = possible_link.get('href')
+                if href and not href.endswith('/upload') and not href.startswith('/upload'):
+                    link_container = possible_link
                     break
+            if link_container:
+                break
         
         if link_container:
             href = link_container.get('href')
             if href and href != '#':
-                print(f"[OTHER] Found href: {href}")
                 link = URL(href)
-                print(f"[OTHER] Created URL object: {link}")
                 
                 # Check if this is a get.bunkrr.su link (used for downloads)
                 if link.host and 'get.bunkr' in link.host:
-                    print("[OTHER] Link is to get.bunkrr.su, calling reinforced_link")
                     link = await self.reinforced_link(link)
                     
                     if not link:
                         # Try to derive link from file ID if reinforced_link fails
                         file_id = href.split('/')[-1]
-                        print(f"[OTHER] Reinforced link failed, using file_id: {file_id}")
                         
                         # Get title to determine if it's a video or image
-                        title_tag = soup.select_one('h1') or soup.select_one('title')
+                        title_tag = soup.find('h1') or soup.find('title')
                         if title_tag:
                             title_text = title_tag.text.strip().lower()
                             if '.mp4' in title_text or '.webm' in title_text or 'video' in title_text:
-                                print("[OTHER] Title suggests this is a video file")
-                                # Try CDN domains for video
-                                cdn_domains = [
-                                    "nachos.bunkr.ru", "wings.bunkr.ru", "wiener.bunkr.ru",
-                                    "ramen.bunkr.ru", "pizza.bunkr.ru", "burger.bunkr.ru", 
-                                    "fries.bunkr.ru", "meatballs.bunkr.ru", "milkshake.bunkr.ru",
-                                    "kebab.bunkr.ru", "taquito.bunkr.ru", "soup.bunkr.ru"
-                                ]
-                                
-                                for cdn in cdn_domains:
-                                    link = URL(f"https://{cdn}/{file_id}.mp4")
-                                    print(f"[OTHER] Trying CDN URL for video: {link}")
-                                    break
+                                link = URL.build(scheme="https", host=VIDEO_CDN_DOMAINS[0], path=f"/{file_id}.mp4")
                             else:
                                 # Probably an image
-                                print("[OTHER] Title suggests this is an image file")
-                                link = URL(f"https://i-wings.bunkr.ru/{file_id}.webp")
-                                print(f"[OTHER] Using image URL: {link}")
+                                link = URL.build(scheme="https", host="i-wings.bunkr.ru", path=f"/{file_id}.webp")
                         
-                    if filename and ext:
-                        print(f"[OTHER] Using existing filename: {filename}, ext: {ext}")
-                    else:
+                    if not filename or not ext:
                         try:
-                            filename, ext = await get_filename_and_ext(link.name)
-                            print(f"[OTHER] Got filename from link: {filename}, ext: {ext}")
+                            filename, ext = get_filename_and_ext(link.name)
                         except (NoExtensionFailure, AttributeError):
                             # Try to determine type from title
-                            title_tag = soup.select_one('h1.text-subs') or soup.select_one('title')
+                            title_tag = soup.find('h1', class_='text-subs') or soup.find('title')
                             if title_tag:
-                                title_text = title_tag.text.strip().lower()
-                                if '.mp4' in title_text or '.webm' in title_text:
-                                    filename = title_tag.text.strip().split('|')[0].strip() if '|' in title_tag.text else title_tag.text.strip()
+                                title_text = title_tag.text.strip()
+                                title_lower = title_text.lower()
+                                if '.mp4' in title_lower or '.webm' in title_lower:
+                                    filename = title_text.partition('|')[0].strip()
                                     ext = ".mp4"
-                                elif '.jpg' in title_text or '.jpeg' in title_text or '.webp' in title_text or '.png' in title_text:
-                                    filename = title_tag.text.strip().split('|')[0].strip() if '|' in title_tag.text else title_tag.text.strip()
-                                    ext = ".webp" if ".webp" in title_text else ".jpg"
+                                elif '.jpg' in title_lower or '.jpeg' in title_lower or '.webp' in title_lower or '.png' in title_lower:
+                                    filename = title_text.partition('|')[0].strip()
+                                    ext = ".webp" if ".webp" in title_lower else ".jpg"
                                 else:
                                     filename = scrape_item.url.parts[-1]
                                     ext = ".mp4"  # Default to video if can't determine
-                                print(f"[OTHER] Determined from title: {filename} with ext: {ext}")
                             else:
                                 filename = scrape_item.url.parts[-1]
                                 ext = ".mp4"
-                                print(f"[OTHER] Using URL part: {filename} with default ext: {ext}")
                         
                     if link:
-                        print(f"[OTHER] Calling handle_file with: link={link}, filename={filename}, ext={ext}")
                         await self.handle_file(link, scrape_item, filename, ext)
                         return
         
         # Last resort - try to extract video information directly
-        print("[OTHER] No direct link found, attempting to extract video information")
         
         video_url, extracted_filename, extracted_ext = await self.extract_video_from_get_page(soup, scrape_item.url)
         if video_url:
-            print(f"[OTHER] Successfully extracted video URL: {video_url}")
             if extracted_filename and extracted_ext:
                 filename = extracted_filename
                 ext = extracted_ext
-                print(f"[OTHER] Using extracted filename: {filename}, ext: {ext}")
             elif not filename or not ext:
                 try:
-                    filename, ext = await get_filename_and_ext(video_url.name)
-                    print(f"[OTHER] Got filename from video URL: {filename}, ext: {ext}")
+                    filename, ext = get_filename_and_ext(video_url.name)
                 except NoExtensionFailure:
                     filename = scrape_item.url.parts[-1]
                     ext = ".mp4"
-                    print(f"[OTHER] Using URL part: {filename} with default ext: {ext}")
             
-            print(f"[OTHER] Calling handle_file with: link={video_url}, filename={filename}, ext={ext}")
             await self.handle_file(video_url, scrape_item, filename, ext)
             return
         
         # Ultimate fallback - try to construct a CDN URL from file ID in URL
         if len(scrape_item.url.parts) > 1:
             file_id = scrape_item.url.parts[-1]
-            print(f"[OTHER] Last resort - using file ID from URL: {file_id}")
             
             # Try to determine if it's a video or image from available clues
             is_likely_video = False
-            title_tag = soup.select_one('h1.text-subs') or soup.select_one('title')
-            if title_tag:
-                title_text = title_tag.text.strip().lower()
-                if '.mp4' in title_text or '.webm' in title_text or 'video' in title_text:
+            title_tag = soup.find('h1', class_='text-subs') or soup.find('title')
+            title_text = title_tag.text.strip() if title_tag else None
+            if title_text is not None:
+                title_lower = title_text.lower()
+                if '.mp4' in title_lower or '.webm' in title_lower or 'video' in title_lower:
                     is_likely_video = True
             
             if video_element or is_video:
                 is_likely_video = True
             
             if not filename or not ext:
-                if title_tag:
-                    filename = title_tag.text.strip().split('|')[0].strip() if '|' in title_tag.text else title_tag.text.strip()
+                if title_text is not None:
+                    filename = title_text.partition('|')[0].strip()
                 else:
                     filename = file_id
                 
@@ -607,117 +575,70 @@ class BunkrrCrawler(Crawler):
             
             if is_likely_video:
                 # Try standard CDN domain for video
-                video_url = URL(f"https://wings.bunkr.ru/{file_id}{ext}")
+                video_url = URL.build(scheme="https", host="wings.bunkr.ru", path=f"/{file_id}{ext}")
             else:
                 # Try i- prefixed domain for image
-                video_url = URL(f"https://i-wings.bunkr.ru/{file_id}{ext}")
+                video_url = URL.build(scheme="https", host="i-wings.bunkr.ru", path=f"/{file_id}{ext}")
             
-            print(f"[OTHER] Constructed potential URL: {video_url}")
             await self.handle_file(video_url, scrape_item, filename, ext)
             return
             
-        print("[OTHER] Failed to find any usable video source")
-        print(f"Could not find any usable source for {scrape_item.url}")
+        log(f"Could not find any usable source for {scrape_item.url}", 30)
         return
 
     @error_handling_wrapper
     async def extract_video_url_from_scripts(self, soup, url) -> Optional[URL]:
         """Extract video URL directly from script tags, prioritizing gigachad-cdn URLs."""
-        print("[EXTRACT_SCRIPT] Searching for video URLs in script tags")
-        
-        # Extract raw HTML content for regex searching
-        content = str(soup)
-        
-        # First priority: Check for direct gigachad-cdn URL pattern in the entire HTML
-        # More comprehensive pattern to match any subdomain structure for gigachad-cdn
-        gigachad_patterns = [
-            # Standard pattern with .cdn. in the middle
-            r'(https?://[^"\']+\.cdn\.gigachad-cdn\.ru/[^"\']+?\.mp4)',
-            # Alternative pattern with just gigachad-cdn.ru
-            r'(https?://[^"\']+\.gigachad-cdn\.ru/[^"\']+?\.mp4)',
-            # Catch-all pattern for any URL with gigachad-cdn
-            r'(https?://[^"\'\s]+gigachad-cdn[^"\'\s]+\.mp4)'
-        ]
         
-        for pattern in gigachad_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                video_url = URL(matches[0])
-                print(f"[EXTRACT_SCRIPT] Found gigachad-cdn URL in HTML content with pattern {pattern}: {video_url}")
-                return video_url
+        # Extract raw HTML content for regex searching, skipping entity escaping so URLs keep their literal &
+        content = soup.decode(formatter=None)
         
-        # Second priority: Extract from source element in the raw HTML
-        source_patterns = [
-            r'<source\s+src="([^"]+?\.mp4)"',
-            r'<source\s+src=\'([^\']+?\.mp4)\'',
-            r'<source\s+.*?src="([^"]+?\.mp4)"',
-            r'source\.src\s*=\s*["\']([^"\']+?\.mp4)["\']'
-        ]
+        # Everything but the video tags looks for an mp4 link, so pages without one skip straight to them
+        has_mp4 = '.mp4' in content
+        if has_mp4:
+            # First priority: Check for direct gigachad-cdn URL pattern in the entire HTML
+            # More comprehensive pattern to match any subdomain structure for gigachad-cdn
+            for pattern in GIGACHAD_MP4_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    video_url = URL(match.group(1))
+                    return video_url
         
-        for pattern in source_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                video_url = URL(matches[0])
-                print(f"[EXTRACT_SCRIPT] Found source element in HTML content with pattern {pattern}: {video_url}")
-                return video_url
+            # Second priority: Extract from source element in the raw HTML
+            for pattern in SOURCE_MP4_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    video_url = URL(match.group(1))
+                    return video_url
         
-        # Third priority: Look for data attributes containing video URLs
-        data_patterns = [
-            r'data-src="([^"]+?\.mp4)"',
-            r'data-video="([^"]+?\.mp4)"',
-            r'data-url="([^"]+?\.mp4)"',
-            r'data-source="([^"]+?\.mp4)"'
-        ]
+            # Third priority: Look for data attributes containing video URLs
+            for pattern in DATA_MP4_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    video_url = URL(match.group(1))
+                    return video_url
         
-        for pattern in data_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                video_url = URL(matches[0])
-                print(f"[EXTRACT_SCRIPT] Found video URL in data attribute with pattern {pattern}: {video_url}")
+            # Fourth priority: Check scripts for direct video URLs
+            # gigachad-cdn URLs inside scripts were already covered by the first priority scan of the whole page
+            script_match = SCRIPT_MP4_PATTERN.search(content)
+            if script_match:
+                video_url = URL(script_match.group(1))
                 return video_url
         
-        # Fourth priority: Check scripts for direct video URLs
-        for script in soup.select('script'):
-            if not script.string:
-                continue
-                
-            # Check for gigachad-cdn pattern in scripts
-            if 'gigachad-cdn' in script.string:
-                print("[EXTRACT_SCRIPT] Found script with gigachad-cdn reference")
-                
-                # Try all patterns
-                for pattern in gigachad_patterns:
-                    matches = re.findall(pattern, script.string)
-                    if matches:
-                        video_url = URL(matches[0])
-                        print(f"[EXTRACT_SCRIPT] Extracted gigachad-cdn video URL: {video_url}")
+            # Check script data attributes
+            for script in SCRIPT_VIDEO_SELECTOR.select(soup):
+                for attr in SCRIPT_VIDEO_ATTRS:
+                    value = script.get(attr)
+                    if value and '.mp4' in value:
+                        video_url = URL(value)
                         return video_url
-            
-            # Look for any mp4 URL in scripts
-            if '.mp4' in script.string:
-                print("[EXTRACT_SCRIPT] Found script with mp4 reference")
-                matches = re.findall(r'(https?://[^"\']+?\.mp4)', script.string)
-                if matches:
-                    video_url = URL(matches[0])
-                    print(f"[EXTRACT_SCRIPT] Extracted generic video URL: {video_url}")
-                    return video_url
-        
-        # Check script data attributes
-        for script in soup.select('script[data-video], script[data-src], script[data-url], script[data-source], script[data-player]'):
-            for attr in ['data-video', 'data-src', 'data-url', 'data-source', 'data-player']:
-                value = script.get(attr)
-                if value and '.mp4' in value:
-                    video_url = URL(value)
-                    print(f"[EXTRACT_SCRIPT] Found video URL in script {attr}: {video_url}")
-                    return video_url
         
         # Look for direct source elements in video tags
         video_tags = soup.select('video')
         for video in video_tags:
-            source = video.select_one('source')
+            source = video.find('source')
             if source and source.get('src'):
                 video_url = URL(source.get('src'))
-                print(f"[EXTRACT_SCRIPT] Found direct source in video element: {video_url}")
                 return video_url
             
             # Check video element data attributes
@@ -725,145 +646,77 @@ class BunkrrCrawler(Crawler):
                 value = video.get(attr)
                 if value and '.mp4' in value:
                     video_url = URL(value)
-                    print(f"[EXTRACT_SCRIPT] Found video URL in video {attr}: {video_url}")
                     return video_url
         
         # Last resort: check for raw mp4 URLs anywhere in the HTML
-        raw_mp4_urls = re.findall(r'https?://[^"\'\s<>]+\.mp4', content)
-        if raw_mp4_urls:
-            video_url = URL(raw_mp4_urls[0])
-            print(f"[EXTRACT_SCRIPT] Found raw mp4 URL in HTML: {video_url}")
+        raw_mp4_match = RAW_MP4_PATTERN.search(content) if has_mp4 else None
+        if raw_mp4_match:
+            video_url = URL(raw_mp4_match.group())
             return video_url
         
-        print("[EXTRACT_SCRIPT] No video URLs found in scripts or HTML")
         return None
 
     @error_handling_wrapper
     async def extract_video_from_get_page(self, soup, url) -> Tuple[Optional[URL], Optional[str], Optional[str]]:
-        print(f"[EXTRACT_VIDEO] Starting extraction for URL: {url}")
         
+        # Look up the elements the fallbacks below share once
+        title_tag = soup.find('h1')
+        video_element = soup.find('video')
+        url_file_id = url.parts[-1] if len(url.parts) > 1 else None
+        url_name = url_file_id if url_file_id is not None else "video"
+
         # First try to extract from scripts - most reliable for dynamically loaded content
         script_video_url = await self.extract_video_url_from_scripts(soup, url)
         if script_video_url:
-            print(f"[EXTRACT_VIDEO] Using video URL from scripts: {script_video_url}")
             
             # Get filename and extension from title or default
-            title_tag = soup.select_one('h1') or soup.select_one('title')
-            if title_tag:
-                title_text = title_tag.text.strip()
-                try:
-                    filename, ext = await get_filename_and_ext(title_text)
-                    print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                except NoExtensionFailure:
-                    # If no extension in title, use default
-                    filename = title_text.split('|')[0].strip() if '|' in title_text else title_text
-                    ext = ".mp4"  # Default for video
-                    print(f"[EXTRACT_VIDEO] Using title with default extension: {filename}, ext: {ext}")
+            page_title = title_tag or soup.find('title')
+            if page_title:
+                title_text = page_title.text.strip()
+                filename, ext = await self.resolve_filename(title_text, fallback=(title_text.partition('|')[0].strip(), ".mp4"))
             else:
                 # No title available, try to get from URL or use default
-                try:
-                    filename, ext = await get_filename_and_ext(script_video_url.name)
-                    print(f"[EXTRACT_VIDEO] Extracted filename from URL: {filename}, ext: {ext}")
-                except NoExtensionFailure:
-                    filename = url.parts[-1] if url.parts and len(url.parts) > 1 else "video"
-                    ext = ".mp4"
-                    print(f"[EXTRACT_VIDEO] Using URL part or default as filename: {filename}, ext: {ext}")
+                filename, ext = await self.resolve_filename(script_video_url.name, fallback=(url_name, ".mp4"))
             
             return script_video_url, filename, ext
         
         # First, try to directly extract video source from video element
-        video_element = soup.select_one('video')
-        if video_element:
-            source_element = video_element.select_one('source')
-            if source_element and source_element.get('src'):
-                video_src = source_element.get('src')
-                print(f"[EXTRACT_VIDEO] Found direct video source URL: {video_src}")
-                return URL(video_src), None, None
+        source_element = video_element.find('source') if video_element else None
+        if source_element and source_element.get('src'):
+            video_src = source_element.get('src')
+            return URL(video_src), None, None
+        
+        # The og:image thumbnail feeds both the image and the CDN fallbacks
+        meta_image = soup.find('meta', property='og:image')
+        meta_image_url = meta_image.get('content') if meta_image else None
         
         # Check if we're dealing with an image by examining the title
-        title_tag = soup.select_one('h1')
+        title_text = title_tag.text.strip() if title_tag else None
+        fallback_name = title_text if title_tag else url_name
         if title_tag:
-            title_text = title_tag.text.strip()
-            print(f"[EXTRACT_VIDEO] Found title: {title_text}")
+            title_lower = title_text.lower()
             
             # Check if it's an image based on extension in title
-            if any(ext in title_text.lower() for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']):
-                print("[EXTRACT_VIDEO] Title indicates this is an image file")
+            title_image_ext = ext_from_title(title_lower)
+            if title_image_ext:
                 
-                # Look for image URLs in the page
-                img_tags = soup.select('figure img[src*="bunkr.ru"]')
-                if img_tags:
-                    # Use the main image (not the blurred background one)
-                    for img in img_tags:
-                        if 'blur' not in img.get('class', '') and not img.get('src', '').endswith('thumbs/'):
-                            image_url = URL(img.get('src'))
-                            print(f"[EXTRACT_VIDEO] Found direct image URL: {image_url}")
-                            
-                            try:
-                                filename, ext = await get_filename_and_ext(image_url.name)
-                                print(f"[EXTRACT_VIDEO] Extracted filename from URL: {filename}, ext: {ext}")
-                                return image_url, filename, ext
-                            except NoExtensionFailure:
-                                # Use title as filename
-                                try:
-                                    filename, ext = await get_filename_and_ext(title_text)
-                                    print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                                    return image_url, filename, ext
-                                except NoExtensionFailure:
-                                    # Determine extension from title text or URL
-                                    if '.webp' in title_text.lower():
-                                        ext = '.webp'
-                                    elif '.jpg' in title_text.lower() or '.jpeg' in title_text.lower():
-                                        ext = '.jpg'
-                                    elif '.png' in title_text.lower():
-                                        ext = '.png'
-                                    elif '.gif' in title_text.lower():
-                                        ext = '.gif'
-                                    else:
-                                        ext = '.webp'  # Default to webp
-                                    
-                                    filename = title_text
-                                    print(f"[EXTRACT_VIDEO] Using title with derived extension: {filename}, ext: {ext}")
-                                    return image_url, filename, ext
+                # Look for the main image in the page (not the blurred background one)
+                img = MAIN_IMAGE_SELECTOR.select_one(soup)
+                if img:
+                    image_url = URL(img.get('src'))
+                    filename, ext = await self.resolve_filename(image_url.name, title_text, fallback=(title_text, title_image_ext))
+                    return image_url, filename, ext
                 
                 # Try finding "enlarge image" link
-                enlarge_link = soup.select_one('a[href*="bunkr.ru"][href*=".webp"], a[href*="bunkr.ru"][href*=".jpg"], a[href*="bunkr.ru"][href*=".png"]')
+                enlarge_link = ENLARGE_LINK_SELECTOR.select_one(soup)
                 if enlarge_link:
                     image_url = URL(enlarge_link.get('href'))
-                    print(f"[EXTRACT_VIDEO] Found direct image URL from enlarge link: {image_url}")
-                    
-                    try:
-                        filename, ext = await get_filename_and_ext(image_url.name)
-                        print(f"[EXTRACT_VIDEO] Extracted filename from URL: {filename}, ext: {ext}")
-                        return image_url, filename, ext
-                    except NoExtensionFailure:
-                        # Use title as filename
-                        try:
-                            filename, ext = await get_filename_and_ext(title_text)
-                            print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                            return image_url, filename, ext
-                        except NoExtensionFailure:
-                            # If no extension in title, derive from title text
-                            if '.webp' in title_text.lower():
-                                ext = '.webp'
-                            elif '.jpg' in title_text.lower() or '.jpeg' in title_text.lower():
-                                ext = '.jpg'
-                            elif '.png' in title_text.lower():
-                                ext = '.png'
-                            elif '.gif' in title_text.lower():
-                                ext = '.gif'
-                            else:
-                                ext = '.webp'  # Default to webp
-                            
-                            filename = title_text
-                            print(f"[EXTRACT_VIDEO] Using title with derived extension: {filename}, ext: {ext}")
-                            return image_url, filename, ext
+                    filename, ext = await self.resolve_filename(image_url.name, title_text, fallback=(title_text, title_image_ext))
+                    return image_url, filename, ext
                 
                 # Try meta image
-                meta_image = soup.select_one('meta[property="og:image"]')
-                if meta_image and meta_image.get('content'):
-                    image_url_str = meta_image.get('content')
-                    print(f"[EXTRACT_VIDEO] Found meta image: {image_url_str}")
+                if meta_image_url:
+                    image_url_str = meta_image_url
                     
                     # Convert thumbs URL to direct image URL
                     if 'thumbs' in image_url_str:
@@ -872,141 +725,55 @@ class BunkrrCrawler(Crawler):
                             image_url_str = image_url_str[:-4]
                         
                         # Add extension based on title
-                        if '.webp' in title_text.lower():
-                            image_url_str += '.webp'
-                        elif '.jpg' in title_text.lower() or '.jpeg' in title_text.lower():
-                            image_url_str += '.jpg'
-                        elif '.png' in title_text.lower():
-                            image_url_str += '.png'
-                        elif '.gif' in title_text.lower():
-                            image_url_str += '.gif'
-                        else:
-                            image_url_str += '.webp'  # Default
+                        image_url_str += title_image_ext
                     
                     image_url = URL(image_url_str)
-                    print(f"[EXTRACT_VIDEO] Constructed image URL: {image_url}")
-                    
-                    try:
-                        filename, ext = await get_filename_and_ext(title_text)
-                        print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                        return image_url, filename, ext
-                    except NoExtensionFailure:
-                        # If no extension in title, derive from title text
-                        if '.webp' in title_text.lower():
-                            ext = '.webp'
-                        elif '.jpg' in title_text.lower() or '.jpeg' in title_text.lower():
-                            ext = '.jpg'
-                        elif '.png' in title_text.lower():
-                            ext = '.png'
-                        elif '.gif' in title_text.lower():
-                            ext = '.gif'
-                        else:
-                            ext = '.webp'  # Default to webp
-                        
-                        filename = title_text
-                        print(f"[EXTRACT_VIDEO] Using title with derived extension: {filename}, ext: {ext}")
-                        return image_url, filename, ext
+                    filename, ext = await self.resolve_filename(title_text, fallback=(title_text, title_image_ext))
+                    return image_url, filename, ext
         
         # If not an image or no image found, continue with video extraction
-        print("[EXTRACT_VIDEO] Looking for video source first")
         
         # Try to find video player and direct source
-        player_element = soup.select_one('div.plyr__video-wrapper')
+        player_element = soup.find('div', class_='plyr__video-wrapper')
         if player_element:
-            print("[EXTRACT_VIDEO] Found video player element")
-            video_element = player_element.select_one('video')
+            video_element = player_element.find('video')
             if video_element:
-                print("[EXTRACT_VIDEO] Found video element within player")
-                source_element = video_element.select_one('source')
+                source_element = video_element.find('source')
                 if source_element and source_element.get('src'):
-                    print("[EXTRACT_VIDEO] Found source element with src")
                     video_url = URL(source_element.get('src'))
-                    print(f"[EXTRACT_VIDEO] Extracted video URL from source: {video_url}")
-                    
-                    # Try to extract filename from the URL
-                    try:
-                        filename, ext = await get_filename_and_ext(video_url.name)
-                        print(f"[EXTRACT_VIDEO] Extracted filename from URL: {filename}, ext: {ext}")
-                    except NoExtensionFailure:
-                        # Try to get filename from title
-                        if title_tag:
-                            try:
-                                filename, ext = await get_filename_and_ext(title_tag.text.strip())
-                                print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                            except NoExtensionFailure:
-                                # If no extension in title, use default
-                                filename = title_tag.text.strip()
-                                ext = ".mp4"  # Default for video
-                                print(f"[EXTRACT_VIDEO] Using title with default extension: {filename}, ext: {ext}")
-                        else:
-                            # No title available, use the URL part as filename
-                            if url.parts and len(url.parts) > 1:
-                                filename = url.parts[-1]
-                            else:
-                                filename = "video"
-                            ext = ".mp4"
-                            print(f"[EXTRACT_VIDEO] Using URL part or default as filename: {filename}, ext: {ext}")
                     
+                    # Try to extract filename from the URL, then the title
+                    filename, ext = await self.resolve_filename(video_url.name, title_text, fallback=(fallback_name, ".mp4"))
                     return video_url, filename, ext
         
         # Extract title and try to get video file from scripts
         if title_tag:
-            try:
-                filename, ext = await get_filename_and_ext(title_tag.text.strip())
-                print(f"[EXTRACT_VIDEO] Extracted filename from title: {filename}, ext: {ext}")
-            except NoExtensionFailure:
-                # If no extension in title, check if there's any hint in the text
-                title_text = title_tag.text.strip()
-                if '.mp4' in title_text.lower():
-                    ext = '.mp4'
-                elif '.webm' in title_text.lower():
-                    ext = '.webm'
-                else:
-                    ext = '.mp4'  # Default for videos
-                
-                filename = title_text
-                print(f"[EXTRACT_VIDEO] Using title with derived extension: {filename}, ext: {ext}")
+            # If no extension in title, check if there's any hint in the text
+            title_ext = '.webm' if '.webm' in title_lower and '.mp4' not in title_lower else '.mp4'
+            filename, ext = await self.resolve_filename(title_text, fallback=(title_text, title_ext))
             
             # Try to find direct video source in the HTML content
-            video_element = soup.select_one('video')
-            if video_element and video_element.select_one('source[src]'):
-                video_src = video_element.select_one('source[src]').get('src')
+            source_element = video_element.find('source', src=True) if video_element else None
+            if source_element:
+                video_src = source_element.get('src')
                 if video_src:
-                    print(f"[EXTRACT_VIDEO] Found direct video source in HTML: {video_src}")
                     video_url = URL(video_src)
                     return video_url, filename, ext
                     
-            # Try to find video URL in any script tag with the file or CDN information
-            for script in soup.select('script'):
-                if script.string:
-                    # Look for direct video URLs with the specific format
-                    if 'gigachad-cdn.ru' in script.string:
-                        print("[EXTRACT_VIDEO] Found script with gigachad-cdn reference")
-                        # Try to extract the full URL with regex
-                        matches = re.findall(r'https?://[^"\']+\.mp4', script.string)
-                        if matches:
-                            video_url = URL(matches[0])
-                            print(f"[EXTRACT_VIDEO] Extracted gigachad-cdn video URL from script: {video_url}")
-                            return video_url, filename, ext
-            
             # Try to find UUID in meta image tag first (preferred over file ID)
             uuid = None
-            meta_image = soup.select_one('meta[property="og:image"]')
-            if meta_image and meta_image.get('content'):
-                image_url = meta_image.get('content')
-                print(f"[EXTRACT_VIDEO] Found meta image: {image_url}")
+            if meta_image_url:
+                image_url = meta_image_url
                 
                 # Extract UUID from meta image URL
-                uuid_match = re.search(r'([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})', image_url)
+                uuid_match = UUID_PATTERN.search(image_url)
                 if uuid_match:
                     uuid = uuid_match.group(1)
-                    print(f"[EXTRACT_VIDEO] Extracted UUID from meta image: {uuid}")
                 else:
                     # Try another pattern (without dashes)
-                    uuid_match = re.search(r'/thumbs/([a-f0-9]{32})', image_url)
+                    uuid_match = THUMBS_ID_PATTERN.search(image_url)
                     if uuid_match:
                         uuid = uuid_match.group(1)
-                        print(f"[EXTRACT_VIDEO] Extracted UUID (no dashes) from meta image: {uuid}")
                     else:
                         # Try to get any filename without extension
                         parts = image_url.split('/')
@@ -1014,305 +781,148 @@ class BunkrrCrawler(Crawler):
                             potential_uuid = parts[-1].split('.')[0]
                             if len(potential_uuid) > 8:  # Minimum length for a reasonable ID
                                 uuid = potential_uuid
-                                print(f"[EXTRACT_VIDEO] Extracted potential ID from meta image: {uuid}")
             
             # If UUID was found in meta image, use it to construct the video URL
             if uuid:
-                # Extract CDN domain from meta image
-                cdn_domain = None
-                if meta_image and meta_image.get('content'):
-                    image_url = meta_image.get('content')
-                    try:
-                        parsed_url = URL(image_url)
-                        if parsed_url.host and 'bunkr' in parsed_url.host:
-                            # Get the CDN domain without the i- prefix for videos
-                            cdn_domain = parsed_url.host
-                            if cdn_domain.startswith('i-'):
-                                cdn_domain = cdn_domain.replace('i-', '')
-                            print(f"[EXTRACT_VIDEO] Extracted CDN domain from meta image: {cdn_domain}")
-                    except Exception as e:
-                        print(f"[EXTRACT_VIDEO] Error extracting CDN domain: {e}")
-                
-                if cdn_domain:
-                    # Construct video URL using the CDN domain and UUID (not numeric file ID)
-                    video_url = URL(f"https://{cdn_domain}/{uuid}.mp4")
-                    print(f"[EXTRACT_VIDEO] Constructed video URL with UUID: {video_url}")
-                    return video_url, filename, ext
-                else:
-                    # Fallback to standard CDNs with UUID
-                    cdn_domains = [
-                        "nachos.bunkr.ru", "wings.bunkr.ru", "wiener.bunkr.ru",
-                        "ramen.bunkr.ru", "pizza.bunkr.ru", "burger.bunkr.ru", 
-                        "fries.bunkr.ru", "meatballs.bunkr.ru", "milkshake.bunkr.ru",
-                        "kebab.bunkr.ru", "taquito.bunkr.ru", "soup.bunkr.ru",
-                        "mlk-bk.cdn.gigachad-cdn.ru", "brg-bk.cdn.gigachad-cdn.ru", 
-                        "c1-st.cdn.gigachad-cdn.ru", "f-c1.cdn.gigachad-cdn.ru", 
-                        "k1-cd.cdn.gigachad-cdn.ru"
-                    ]
-                    
-                    # Try each CDN with UUID
-                    for cdn in cdn_domains:
-                        video_url = URL(f"https://{cdn}/{uuid}.mp4")
-                        print(f"[EXTRACT_VIDEO] Trying CDN URL with UUID: {video_url}")
-                        return video_url, filename, ext
+                # Construct video URL using the meta image's CDN domain, falling back to the first standard CDN
+                cdn_domain = cdn_domain_from_image(image_url) or VIDEO_CDN_DOMAINS[0]
+                video_url = URL.build(scheme="https", host=cdn_domain, path=f"/{uuid}.mp4")
+                return video_url, filename, ext
         
         # As fallback, try to find file_id in various places
         file_id = None
         
         # Try to get file_id from data attributes
-        file_tracker = soup.select_one('#fileTracker[data-file-id]')
+        file_tracker = soup.find(id='fileTracker', attrs={'data-file-id': True})
         if file_tracker:
             file_id = file_tracker.get('data-file-id')
-            print(f"[EXTRACT_VIDEO] Found file_id in fileTracker element: {file_id}")
         
         # Try to get file_id from download link
         if not file_id:
-            download_link = soup.select_one('a[href*="get.bunkrr.su/file/"]')
+            download_link = soup.find('a', href=GET_FILE_HREF_PATTERN)
             if download_link and download_link.get('href'):
                 href = download_link.get('href')
                 file_id = href.split('/')[-1]
-                print(f"[EXTRACT_VIDEO] Found file_id in download link: {file_id}")
         
         # Try to get file_id from script tags
         if not file_id:
-            script_tags = soup.select('script[data-file-id]')
-            if script_tags:
-                file_id = script_tags[0].get('data-file-id')
-                print(f"[EXTRACT_VIDEO] Found file_id in script tag: {file_id}")
+            script_tag = SCRIPT_FILE_ID_SELECTOR.select_one(soup)
+            if script_tag:
+                file_id = script_tag.get('data-file-id')
         
         # Try to extract file_id from the URL
-        if not file_id and url.parts and len(url.parts) > 1:
-            file_id = url.parts[-1]
-            print(f"[EXTRACT_VIDEO] Using URL part as file_id: {file_id}")
+        if not file_id:
+            file_id = url_file_id
         
         # Only use numeric file_id if we couldn't find a UUID (which is preferred)
         if file_id:
-            # Try to extract CDN domain from meta image
-            cdn_domain = None
-            meta_image = soup.select_one('meta[property="og:image"]')
-            if meta_image and meta_image.get('content'):
-                image_url = meta_image.get('content')
-                print(f"[EXTRACT_VIDEO] Found meta image: {image_url}")
-                
-                try:
-                    parsed_url = URL(image_url)
-                    if parsed_url.host and 'bunkr' in parsed_url.host:
-                        # Get the CDN domain without the i- prefix for videos
-                        cdn_domain = parsed_url.host
-                        if cdn_domain.startswith('i-'):
-                            cdn_domain = cdn_domain.replace('i-', '')
-                        print(f"[EXTRACT_VIDEO] Extracted CDN domain from meta image: {cdn_domain}")
-                except Exception as e:
-                    print(f"[EXTRACT_VIDEO] Error extracting CDN domain: {e}")
-            
-            if cdn_domain:
-                # Construct video URL using the CDN domain
-                video_url = URL(f"https://{cdn_domain}/{file_id}.mp4")
-                print(f"[EXTRACT_VIDEO] Constructed video URL with file_id: {video_url}")
-                return video_url, filename, ext
-            else:
-                # Fallback to standard CDNs
-                cdn_domains = [
-                    "nachos.bunkr.ru", "wings.bunkr.ru", "wiener.bunkr.ru",
-                    "ramen.bunkr.ru", "pizza.bunkr.ru", "burger.bunkr.ru", 
-                    "fries.bunkr.ru", "meatballs.bunkr.ru", "milkshake.bunkr.ru",
-                    "kebab.bunkr.ru", "taquito.bunkr.ru", "soup.bunkr.ru",
-                    "mlk-bk.cdn.gigachad-cdn.ru", "brg-bk.cdn.gigachad-cdn.ru", 
-                    "c1-st.cdn.gigachad-cdn.ru", "f-c1.cdn.gigachad-cdn.ru", 
-                    "k1-cd.cdn.gigachad-cdn.ru"
-                ]
-                
-                # Try each CDN with file_id
-                for cdn in cdn_domains:
-                    video_url = URL(f"https://{cdn}/{file_id}.mp4")
-                    print(f"[EXTRACT_VIDEO] Trying CDN URL with file_id: {video_url}")
-                    return video_url, filename, ext
+            # Construct video URL using the meta image's CDN domain, falling back to the first standard CDN
+            cdn_domain = cdn_domain_from_image(meta_image_url) or VIDEO_CDN_DOMAINS[0]
+            video_url = URL.build(scheme="https", host=cdn_domain, path=f"/{file_id}.mp4")
+            return video_url, filename, ext
         
         # Last resort - look for video element
-        video_element = soup.select_one('video')
         if video_element:
-            print("[EXTRACT_VIDEO] Found video element")
-            source_element = video_element.select_one('source')
+            source_element = video_element.find('source')
             if source_element and source_element.get('src'):
-                print("[EXTRACT_VIDEO] Found source element with src")
                 video_url = URL(source_element.get('src'))
-                print(f"[EXTRACT_VIDEO] Extracted video URL from source: {video_url}")
-                
-                try:
-                    filename, ext = await get_filename_and_ext(video_url.name)
-                    print(f"[EXTRACT_VIDEO] Extracted filename from URL: {filename}, ext: {ext}")
-                except NoExtensionFailure:
-                    # Try to get filename from title
-                    if title_tag:
-                        try:
-                            filename, ext = await get_filename_and_ext(title_tag.text.strip())
-                            print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                        except NoExtensionFailure:
-                            # If no extension in title, use default
-                            filename = title_tag.text.strip()
-                            ext = ".mp4"  # Default for video
-                            print(f"[EXTRACT_VIDEO] Using title with default extension: {filename}, ext: {ext}")
-                    else:
-                        # No title available, use the URL part as filename
-                        if url.parts and len(url.parts) > 1:
-                            filename = url.parts[-1]
-                        else:
-                            filename = "video"
-                        ext = ".mp4"
-                        print(f"[EXTRACT_VIDEO] Using URL part or default as filename: {filename}, ext: {ext}")
                 
+                filename, ext = await self.resolve_filename(video_url.name, title_text, fallback=(fallback_name, ".mp4"))
                 return video_url, filename, ext
             
             # Try to derive video URL from poster
             poster = video_element.get('poster')
             if poster:
-                print(f"[EXTRACT_VIDEO] Found poster: {poster}")
                 if 'thumbs' in poster:
                     try:
                         # Extract UUID from poster URL
-                        uuid_match = re.search(r'([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})', poster)
+                        uuid_match = UUID_PATTERN.search(poster)
                         if uuid_match:
                             uuid = uuid_match.group(1)
-                            print(f"[EXTRACT_VIDEO] Extracted UUID from poster: {uuid}")
                             
                             # Extract CDN domain from poster
-                            cdn_domain = None
-                            try:
-                                parsed_url = URL(poster)
-                                if parsed_url.host and 'bunkr' in parsed_url.host:
-                                    cdn_domain = parsed_url.host
-                                    if cdn_domain.startswith('i-'):
-                                        cdn_domain = cdn_domain.replace('i-', '')
-                                    print(f"[EXTRACT_VIDEO] Extracted CDN domain from poster: {cdn_domain}")
-                            except Exception as e:
-                                print(f"[EXTRACT_VIDEO] Error extracting CDN domain from poster: {e}")
-                            
+                            cdn_domain = cdn_domain_from_image(poster)
                             if cdn_domain:
-                                video_url = URL(f"https://{cdn_domain}/{uuid}.mp4")
-                                print(f"[EXTRACT_VIDEO] Constructed video URL from poster UUID: {video_url}")
-                                
-                                if title_tag:
-                                    try:
-                                        filename, ext = await get_filename_and_ext(title_tag.text.strip())
-                                        print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                                    except NoExtensionFailure:
-                                        filename = title_tag.text.strip()
-                                        ext = ".mp4"
-                                        print(f"[EXTRACT_VIDEO] Using title with default extension: {filename}, ext: {ext}")
-                                else:
-                                    filename = uuid
-                                    ext = ".mp4"
-                                    print(f"[EXTRACT_VIDEO] Using UUID as filename: {filename}, ext: {ext}")
-                                
+                                video_url = URL.build(scheme="https", host=cdn_domain, path=f"/{uuid}.mp4")
+                                filename, ext = await self.resolve_filename(title_text, fallback=(title_text if title_tag else uuid, ".mp4"))
                                 return video_url, filename, ext
                         else:
-                            # Try to extract file ID or any identifier from poster
-                            poster_parts = poster.split('/')
-                            if poster_parts:
-                                potential_id = poster_parts[-1].split('.')[0]
-                                print(f"[EXTRACT_VIDEO] Found potential ID in poster: {potential_id}")
-                                
-                                # Transform poster URL to video URL
-                                video_url_str = poster.replace('thumbs/', '').replace('.png', '.mp4')
-                                video_url = URL(video_url_str)
-                                print(f"[EXTRACT_VIDEO] Transformed poster to video URL: {video_url}")
-                                
-                                if title_tag:
-                                    try:
-                                        filename, ext = await get_filename_and_ext(title_tag.text.strip())
-                                        print(f"[EXTRACT_VIDEO] Using title as filename: {filename}, ext: {ext}")
-                                    except NoExtensionFailure:
-                                        # If no extension in title, use default
-                                        filename = title_tag.text.strip()
-                                        ext = ".mp4"  # Default for video
-                                        print(f"[EXTRACT_VIDEO] Using title with default extension: {filename}, ext: {ext}")
-                                else:
-                                    # No title available, use the URL part as filename
-                                    if url.parts and len(url.parts) > 1:
-                                        filename = url.parts[-1]
-                                    else:
-                                        filename = "video"
-                                    ext = ".mp4"
-                                    print(f"[EXTRACT_VIDEO] Using URL part or default as filename: {filename}, ext: {ext}")
-                                
-                                return video_url, filename, ext
+                            # Transform poster URL to video URL
+                            video_url = URL(video_link_from_poster(poster, '.png'))
+                            filename, ext = await self.resolve_filename(title_text, fallback=(fallback_name, ".mp4"))
+                            return video_url, filename, ext
                     except Exception as e:
-                        print(f"[EXTRACT_VIDEO] Error transforming poster URL: {e}")
+                        log_debug("Bunkr: error deriving video URL from poster on %s: %r", 10, url, e)
         
-        print("[EXTRACT_VIDEO] No suitable video or image source found")
         return None, None, None
 
     @error_handling_wrapper
     async def reinforced_link(self, url: URL) -> URL:
-        print(f"[REINFORCED_LINK] Starting with URL: {url}")
-        
-        # Check if the URL is likely for an image 
-        file_id = url.parts[-1] if url.parts else None
-        if file_id:
-            print(f"[REINFORCED_LINK] Extracted file ID: {file_id}")
-        
+        """Resolves a download page, callers asking for the same page share a single request"""
+        key = str(url)
+        if key not in self.reinforced_links:
+            if len(self.reinforced_links) >= REINFORCED_CACHE_SIZE:
+                self.reinforced_links.pop(next(iter(self.reinforced_links)))
+            # Not created in manager.task_group, a failed lookup must not cancel the rest of the run
+            task = asyncio.create_task(self.resolve_reinforced_link(url))
+            task.add_done_callback(partial(self.forget_failed_reinforced_link, key))
+            self.reinforced_links[key] = task
+        return await asyncio.shield(self.reinforced_links[key])
+
+    def forget_failed_reinforced_link(self, key: str, task: asyncio.Task) -> None:
+        """Drops a lookup that failed or found nothing so the next caller retries it"""
+        failed = task.cancelled() or task.exception() is not None or task.result() is None
+        if failed and self.reinforced_links.get(key) is task:
+            del self.reinforced_links[key]
+
+    async def resolve_reinforced_link(self, url: URL) -> URL:
+        """Fetches a download page and extracts the media link from it"""
         async with self.request_limiter:
-            print("[REINFORCED_LINK] Getting BS4 for URL")
             soup = await self.client.get_BS4(self.domain, url)
-            print("[REINFORCED_LINK] Got BS4 successfully")
         
         # First, try to extract from scripts - most reliable for dynamically loaded content
         script_video_url = await self.extract_video_url_from_scripts(soup, url)
         if script_video_url:
-            print(f"[REINFORCED_LINK] Using video URL from scripts: {script_video_url}")
             return script_video_url
         
+        # The video tags are needed by both this check and the last fallbacks, collect them once
+        video_elements = soup.find_all('video')
+        
         # First, try to directly extract video source
-        video_element = soup.select_one('video')
-        if video_element:
-            source_element = video_element.select_one('source[src]')
-            if source_element and source_element.get('src'):
-                video_src = source_element.get('src')
-                print(f"[REINFORCED_LINK] Found direct video source URL: {video_src}")
-                return URL(video_src)
+        source_element = video_elements[0].find('source') if video_elements else None
+        if source_element and source_element.get('src'):
+            video_src = source_element.get('src')
+            return URL(video_src)
         
-        # Try to find video URL in any script tag
-        for script in soup.select('script'):
-            if script.string:
-                # Look for specific CDN domains
-                if 'gigachad-cdn.ru' in script.string:
-                    print("[REINFORCED_LINK] Found script with gigachad-cdn reference")
-                    # Try to extract the full URL with regex
-                    matches = re.findall(r'https?://[^"\']+\.mp4', script.string)
-                    if matches:
-                        video_url = URL(matches[0])
-                        print(f"[REINFORCED_LINK] Extracted gigachad-cdn video URL from script: {video_url}")
-                        return video_url
+        # The og:image thumbnail feeds both the image and the CDN fallbacks
+        meta_image = soup.find('meta', property='og:image')
+        meta_image_url = meta_image.get('content') if meta_image else None
+        url_file_id = url.parts[-1] if url.parts else None
         
         # First check if this is an image file by examining the title
-        title_tag = soup.select_one('h1')
+        title_tag = soup.find('h1')
         if title_tag:
             title_text = title_tag.text.strip().lower()
-            print(f"[REINFORCED_LINK] Found title: {title_text}")
             
             # Check if it's an image based on extension in title
-            if any(ext in title_text for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']):
-                print("[REINFORCED_LINK] Title indicates this is an image file")
+            title_image_ext = ext_from_title(title_text)
+            if title_image_ext:
                 
                 # First try to find direct image links
-                for img in soup.select('figure img'):
-                    if not img.get('src', '').endswith('thumbs/'):
-                        image_url = URL(img.get('src'))
-                        print(f"[REINFORCED_LINK] Found direct image URL: {image_url}")
-                        return image_url
+                img = FIGURE_IMAGE_SELECTOR.select_one(soup)
+                if img:
+                    image_url = URL(img.get('src'))
+                    return image_url
                 
                 # Try finding "enlarge image" link
-                enlarge_link = soup.select_one('a[href*="bunkr.ru"][href*=".webp"], a[href*="bunkr.ru"][href*=".jpg"], a[href*="bunkr.ru"][href*=".png"]')
+                enlarge_link = ENLARGE_LINK_SELECTOR.select_one(soup)
                 if enlarge_link:
                     image_url = URL(enlarge_link.get('href'))
-                    print(f"[REINFORCED_LINK] Found direct image URL from enlarge link: {image_url}")
                     return image_url
                 
                 # Try meta image
-                meta_image = soup.select_one('meta[property="og:image"]')
-                if meta_image and meta_image.get('content'):
-                    image_url_str = meta_image.get('content')
-                    print(f"[REINFORCED_LINK] Found meta image: {image_url_str}")
+                if meta_image_url:
+                    image_url_str = meta_image_url
                     
                     # Convert thumbs URL to direct image URL
                     if 'thumbs' in image_url_str:
@@ -1321,343 +931,174 @@ class BunkrrCrawler(Crawler):
                             image_url_str = image_url_str[:-4]
                         
                         # Add extension based on title
-                        if '.webp' in title_text:
-                            image_url_str += '.webp'
-                        elif '.jpg' in title_text or '.jpeg' in title_text:
-                            image_url_str += '.jpg'
-                        elif '.png' in title_text:
-                            image_url_str += '.png'
-                        elif '.gif' in title_text:
-                            image_url_str += '.gif'
-                        else:
-                            image_url_str += '.webp'  # Default
+                        image_url_str += title_image_ext
                     
                     image_url = URL(image_url_str)
-                    print(f"[REINFORCED_LINK] Constructed image URL: {image_url}")
                     return image_url
         
         # If we get here, it's not an image, so continue with video extraction
         if url.host and 'get.bunkr' in url.host:
-            print("[REINFORCED_LINK] Using specialized get.bunkrr.su extraction")
             video_url, _, _ = await self.extract_video_from_get_page(soup, url)
             if video_url:
-                print(f"[REINFORCED_LINK] Successfully extracted video URL: {video_url}")
                 return video_url
             
             # Fallback extraction for get.bunkrr.su pages
-            file_id = url.parts[-1] if url.parts else None
-            print(f"[REINFORCED_LINK] Extracted file ID from URL: {file_id}")
-            
-            if file_id:
-                # Try to extract meta image to get the CDN domain
-                meta_image = soup.select_one('meta[property="og:image"]')
-                if meta_image and meta_image.get('content'):
-                    image_url = meta_image.get('content')
-                    print(f"[REINFORCED_LINK] Found meta image: {image_url}")
-                    
-                    # Try to extract CDN domain from meta image
-                    cdn_domain = None
-                    try:
-                        parsed_url = URL(image_url)
-                        if parsed_url.host and 'bunkr' in parsed_url.host:
-                            cdn_domain = parsed_url.host
-                            if cdn_domain.startswith('i-'):
-                                cdn_domain = cdn_domain.replace('i-', '')
-                            print(f"[REINFORCED_LINK] Extracted CDN domain from meta image: {cdn_domain}")
-                            
-                            # Construct video URL using the CDN domain
-                            video_url = URL(f"https://{cdn_domain}/{file_id}.mp4")
-                            print(f"[REINFORCED_LINK] Constructed video URL: {video_url}")
-                            return video_url
-                    except Exception as e:
-                        print(f"[REINFORCED_LINK] Error extracting CDN domain: {e}")
-                
-                # Fallback to standard CDNs
-                cdn_domains = [
-                    "nachos.bunkr.ru", "wings.bunkr.ru", "wiener.bunkr.ru",
-                    "ramen.bunkr.ru", "pizza.bunkr.ru", "burger.bunkr.ru", 
-                    "fries.bunkr.ru", "meatballs.bunkr.ru", "milkshake.bunkr.ru",
-                    "kebab.bunkr.ru", "taquito.bunkr.ru", "soup.bunkr.ru",
-                    "mlk-bk.cdn.gigachad-cdn.ru", "brg-bk.cdn.gigachad-cdn.ru", 
-                    "c1-st.cdn.gigachad-cdn.ru", "f-c1.cdn.gigachad-cdn.ru", 
-                    "k1-cd.cdn.gigachad-cdn.ru"
-                ]
-                
-                # Try each CDN
-                for cdn in cdn_domains:
-                    video_url = URL(f"https://{cdn}/{file_id}.mp4")
-                    print(f"[REINFORCED_LINK] Trying CDN URL: {video_url}")
-                    return video_url
+            if url_file_id:
+                # Construct video URL using the meta image's CDN domain, falling back to the first standard CDN
+                cdn_domain = cdn_domain_from_image(meta_image_url) or VIDEO_CDN_DOMAINS[0]
+                video_url = URL.build(scheme="https", host=cdn_domain, path=f"/{url_file_id}.mp4")
+                return video_url
         
         try:
-            print("[REINFORCED_LINK] Looking for download links")
-            link_container = soup.select('a[download*=""]')[-1]
-            print("[REINFORCED_LINK] Found download link with a[download*='']")
+            link_container = DOWNLOAD_ATTR_LINK_SELECTOR.select(soup)[-1]
         except IndexError:
-            print("[REINFORCED_LINK] No download link found, trying alternative selector")
             try:
-                link_container = soup.select('a[class*=download]')[-1]
-                print("[REINFORCED_LINK] Found download link with a[class*=download]")
+                link_container = DOWNLOAD_CLASS_LINK_SELECTOR.select(soup)[-1]
             except IndexError:
-                print("[REINFORCED_LINK] No download link found with any selector")
-                title = soup.select_one('h1.text-2xl.text-subs')
+                title = TEXT_SUBS_TITLE_SELECTOR.select_one(soup)
                 if title:
-                    print(f"[REINFORCED_LINK] Found title: {title.text.strip()}")
                     try:
-                        filename = title.text.strip()
-                        print(f"[REINFORCED_LINK] Extracted filename from title: {filename}")
-                        
-                        for element in soup.select('video'):
-                            source = element.select_one('source')
+                        for element in video_elements:
+                            source = element.find('source')
                             if source and source.get('src'):
                                 video_url = URL(source.get('src'))
-                                print(f"[REINFORCED_LINK] Found video source: {video_url}")
                                 return video_url
                         
-                        for video in soup.select('video'):
+                        for video in video_elements:
                             poster = video.get('poster')
                             if poster and 'thumbs' in poster:
-                                print(f"[REINFORCED_LINK] Found poster: {poster}")
                                 try:
-                                    video_url_str = poster.replace('thumbs/', '').replace('_grid.png', '.mp4')
+                                    video_url_str = video_link_from_poster(poster, '_grid.png')
                                     video_url = URL(video_url_str)
-                                    print(f"[REINFORCED_LINK] Transformed poster to video URL: {video_url}")
                                     return video_url
                                 except Exception as e:
-                                    print(f"[REINFORCED_LINK] Error transforming poster URL: {e}")
+                                    log_debug("Bunkr: error transforming poster URL on %s: %r", 10, url, e)
                     except Exception as e:
-                        print(f"[REINFORCED_LINK] Error extracting video URL: {e}")
+                        log_debug("Bunkr: error extracting video URL on %s: %r", 10, url, e)
                 
                 # Try to extract download link
-                download_link = soup.select_one('a[href*="get.bunkrr.su/file/"]')
+                download_link = soup.find('a', href=GET_FILE_HREF_PATTERN)
                 if download_link and download_link.get('href'):
                     download_url = URL(download_link.get('href'))
-                    print(f"[REINFORCED_LINK] Found download link: {download_url}")
                     if download_url.parts and len(download_url.parts) > 1:
                         file_id = download_url.parts[-1]
-                        print(f"[REINFORCED_LINK] Extracted file ID from download link: {file_id}")
                         
-                        # Try to extract meta image to get the CDN domain
-                        meta_image = soup.select_one('meta[property="og:image"]')
-                        cdn_domain = None
-                        if meta_image and meta_image.get('content'):
-                            image_url = meta_image.get('content')
-                            print(f"[REINFORCED_LINK] Found meta image: {image_url}")
-                            
-                            # Try to extract CDN domain from meta image
-                            try:
-                                parsed_url = URL(image_url)
-                                if parsed_url.host and 'bunkr' in parsed_url.host:
-                                    cdn_domain = parsed_url.host
-                                    if cdn_domain.startswith('i-'):
-                                        cdn_domain = cdn_domain.replace('i-', '')
-                                    print(f"[REINFORCED_LINK] Extracted CDN domain from meta image: {cdn_domain}")
-                            except Exception as e:
-                                print(f"[REINFORCED_LINK] Error extracting CDN domain: {e}")
-                        
-                        # Construct video URL using the CDN domain or fallback
-                        if cdn_domain:
-                            video_url = URL(f"https://{cdn_domain}/{file_id}.mp4")
-                            print(f"[REINFORCED_LINK] Constructed video URL with CDN domain: {video_url}")
-                            return video_url
-                        else:
-                            cdn_domains = [
-                                "nachos.bunkr.ru", "wings.bunkr.ru", "wiener.bunkr.ru",
-                                "ramen.bunkr.ru", "pizza.bunkr.ru", "burger.bunkr.ru", 
-                                "fries.bunkr.ru", "meatballs.bunkr.ru", "milkshake.bunkr.ru",
-                                "kebab.bunkr.ru", "taquito.bunkr.ru", "soup.bunkr.ru",
-                                "mlk-bk.cdn.gigachad-cdn.ru", "brg-bk.cdn.gigachad-cdn.ru", 
-                                "c1-st.cdn.gigachad-cdn.ru", "f-c1.cdn.gigachad-cdn.ru", 
-                                "k1-cd.cdn.gigachad-cdn.ru"
-                            ]
-                            
-                            for cdn in cdn_domains:
-                                video_url = URL(f"https://{cdn}/{file_id}.mp4")
-                                print(f"[REINFORCED_LINK] Trying CDN URL: {video_url}")
-                                return video_url
-                
-                # Check for video URLs in scripts
-                for script in soup.select('script'):
-                    if script.string and '.mp4' in script.string:
-                        print("[REINFORCED_LINK] Found script with mp4 reference")
-                        matches = re.findall(r'https?://[^"\']+\.mp4', script.string)
-                        if matches:
-                            video_url = URL(matches[0])
-                            print(f"[REINFORCED_LINK] Extracted video URL from script: {video_url}")
-                            return video_url
+                        # Construct video URL using the meta image's CDN domain, falling back to the first standard CDN
+                        cdn_domain = cdn_domain_from_image(meta_image_url) or VIDEO_CDN_DOMAINS[0]
+                        video_url = URL.build(scheme="https", host=cdn_domain, path=f"/{file_id}.mp4")
+                        return video_url
                 
                 # Check for data-t attributes in scripts
-                scripts = soup.select('script[data-t]')
-                for script in scripts:
-                    data_t = script.get('data-t')
-                    if data_t and ".mp4" in data_t:
-                        print(f"[REINFORCED_LINK] Found data-t attribute with mp4: {data_t}")
-                        video_url = URL(data_t)
+                for script in SCRIPT_DATA_T_MP4_SELECTOR.select(soup):
+                    video_url = URL(script.get('data-t'))
+                    if video_url.path.endswith(".mp4"):
                         return video_url
                 
                 # Last resort - use file ID from URL
-                file_id = url.parts[-1] if url.parts else None
-                if file_id:
-                    print(f"[REINFORCED_LINK] Using file ID from URL: {file_id}")
-                    cdn_domains = [
-                        "nachos.bunkr.ru", "wings.bunkr.ru", "wiener.bunkr.ru",
-                        "ramen.bunkr.ru", "pizza.bunkr.ru", "burger.bunkr.ru", 
-                        "fries.bunkr.ru", "meatballs.bunkr.ru", "milkshake.bunkr.ru",
-                        "kebab.bunkr.ru", "taquito.bunkr.ru", "soup.bunkr.ru",
-                        "mlk-bk.cdn.gigachad-cdn.ru", "brg-bk.cdn.gigachad-cdn.ru", 
-                        "c1-st.cdn.gigachad-cdn.ru", "f-c1.cdn.gigachad-cdn.ru", 
-                        "k1-cd.cdn.gigachad-cdn.ru"
-                    ]
-                    
-                    for cdn in cdn_domains:
-                        video_url = URL(f"https://{cdn}/{file_id}.mp4")
-                        print(f"[REINFORCED_LINK] Trying CDN URL: {video_url}")
-                        return video_url
+                if url_file_id:
+                    video_url = URL.build(scheme="https", host=VIDEO_CDN_DOMAINS[0], path=f"/{url_file_id}.mp4")
+                    return video_url
                 
                 return None
         
         href = link_container.get('href')
         if not href or href == '#':
-            print(f"[REINFORCED_LINK] Found link container but href is {href}, trying extract_video_from_get_page")
             video_url, _, _ = await self.extract_video_from_get_page(soup, url)
             if video_url:
-                print(f"[REINFORCED_LINK] Successfully extracted video URL: {video_url}")
                 return video_url
             
-            print("[REINFORCED_LINK] extract_video_from_get_page failed, trying alternative approaches")
             try:
-                title = soup.select_one('h1.text-2xl')
+                title = soup.find('h1', class_='text-2xl')
                 if title:
-                    print(f"[REINFORCED_LINK] Found title element: {title.text.strip()}")
                     
-                    video = soup.select_one('video')
+                    video = soup.find('video')
                     if video:
-                        source = video.select_one('source')
+                        source = video.find('source')
                         if source and source.get('src'):
                             video_url = URL(source.get('src'))
-                            print(f"[REINFORCED_LINK] Found video source: {video_url}")
                             return video_url
                         
                         poster = video.get('poster')
                         if poster and 'thumbs' in poster:
-                            print(f"[REINFORCED_LINK] Found poster: {poster}")
                             try:
-                                video_url_str = poster.replace('thumbs/', '').replace('_grid.png', '.mp4')
+                                video_url_str = video_link_from_poster(poster, '_grid.png')
                                 video_url = URL(video_url_str)
-                                print(f"[REINFORCED_LINK] Transformed poster to video URL: {video_url}")
                                 return video_url
                             except Exception as e:
-                                print(f"[REINFORCED_LINK] Error transforming poster URL: {e}")
+                                log_debug("Bunkr: error transforming poster URL on %s: %r", 10, url, e)
             except Exception as e:
-                print(f"[REINFORCED_LINK] Error finding alternative source: {e}")
+                log_debug("Bunkr: error finding alternative source on %s: %r", 10, url, e)
             return None
             
-        print(f"[REINFORCED_LINK] Got href: {href}")
         link = URL(href)
-        print(f"[REINFORCED_LINK] Returning URL: {link}")
         return link
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
-    async def get_stream_link(self, url: URL) -> URL:
-        print(f"[GET_STREAM_LINK] Starting with URL: {url}")
-        cdn_domains = [
-            "wiener", "i-wiener", "ramen", "i-ramen", "nachos", "i-nachos",
-            "wings", "i-wings", "pizza", "i-pizza", "burger", "i-burger", 
-            "fries", "i-fries", "meatballs", "i-meatballs", "milkshake", "i-milkshake",
-            "kebab", "i-kebab", "taquito", "i-taquito", "soup", "i-soup",
-            "cdn-wiener", "cdn-ramen", "cdn-pizza", "cdn-burger", "cdn-meatballs", 
-            "cdn-milkshake", "cdn-kebab", "cdn-taquito", "cdn-soup", "cdn-nachos",
-            "cdn-fries", "cdn-wings", "cdn", "c", "media-files", 
-            "mlk-bk.cdn.gigachad-cdn", "brg-bk.cdn.gigachad-cdn", 
-            "c1-st.cdn.gigachad-cdn", "f-c1.cdn.gigachad-cdn", "k1-cd.cdn.gigachad-cdn"
-        ]
-        
-        if not url.host:
-            print(f"[GET_STREAM_LINK] URL has no host, returning as is: {url}")
-            return url
-            
-        host_parts = url.host.split('.')
-        bunkr_tlds = ["ru", "sk", "pk", "su", "black", "cr"]
-        
-        print(f"[GET_STREAM_LINK] Host parts: {host_parts}")
-        
-        is_cdn = False
-        if len(host_parts) > 1:
-            domain_part = host_parts[0]
-            print(f"[GET_STREAM_LINK] Domain part: {domain_part}")
-            
-            for cdn in cdn_domains:
-                if domain_part == cdn or domain_part.startswith(f"{cdn}-") or domain_part.startswith(f"{cdn}"):
-                    print(f"[GET_STREAM_LINK] Matched CDN domain: {cdn}")
-                    is_cdn = True
-                    break
-            
-            if is_cdn and len(host_parts) > 1:
-                tld = host_parts[-1]
-                print(f"[GET_STREAM_LINK] TLD: {tld}")
-                if tld not in bunkr_tlds and tld.startswith('bunkr'):
-                    print("[GET_STREAM_LINK] TLD starts with 'bunkr', marking as CDN")
-                    is_cdn = True
-        
-        if not is_cdn:
-            print(f"[GET_STREAM_LINK] Not a CDN URL, returning as is: {url}")
-            return url
-
-        ext = url.suffix.lower() if url.suffix else ""
-        print(f"[GET_STREAM_LINK] URL extension: {ext}")
-        if ext == "":
-            print("[GET_STREAM_LINK] No extension, returning as is")
-            return url
+    @error_handling_wrapper
+    async def direct_image(self, scrape_item: ScrapeItem) -> None:
+        """Hands a direct CDN image link straight to the downloader, with its /d/ page as the referer"""
+        link = scrape_item.url
+        page_item = await self.create_scrape_item(scrape_item, self.primary_file_base / link.name, "")
+        if await self.check_complete_from_referer(page_item):
+            return
 
-        print(f"[GET_STREAM_LINK] URL parts: {url.parts}")
-        if not url.parts or len(url.parts) < 1:
-            print("[GET_STREAM_LINK] No URL parts, returning as is")
-            return url
-            
-        original_url = url
-        if ext in FILE_FORMATS['Images']:
-            print(f"[GET_STREAM_LINK] Image extension detected: {ext}")
-            url = self.primary_base_domain / "d" / url.parts[-1]
-        elif ext in FILE_FORMATS['Videos']:
-            print(f"[GET_STREAM_LINK] Video extension detected: {ext}")
-            url = self.primary_base_domain / "v" / url.parts[-1]
-        else:
-            print(f"[GET_STREAM_LINK] Other extension detected: {ext}")
-            url = self.primary_base_domain / "d" / url.parts[-1]
+        filename, ext = get_filename_and_ext(link.name)
+        await self.handle_file(link, page_item, filename, ext)
 
-        print(f"[GET_STREAM_LINK] Transformed URL from {original_url} to {url}")
-        return url
+    async def filename_from_title(self, title_tag, scrape_item: ScrapeItem) -> Tuple[str, str]:
+        """Gets the filename from a "name | site" page title, falling back to the URL's last part as an mp4"""
+        if title_tag:
+            possible_filename = title_tag.text.partition('|')[0].strip()
+            if '.' in possible_filename:
+                try:
+                    return get_filename_and_ext(possible_filename)
+                except NoExtensionFailure:
+                    pass
+        return scrape_item.url.parts[-1], ".mp4"
 
-    async def parse_datetime(self, date: str) -> int:
-        date = datetime.datetime.strptime(date, "%H:%M:%S %d/%m/%Y")
-        return calendar.timegm(date.timetuple())
+    async def resolve_filename(self, *candidates: Optional[str], fallback: Tuple[str, str]) -> Tuple[str, str]:
+        """Gets the filename from the first candidate that has an extension, falling back to the given filename and extension"""
+        for candidate in candidates:
+            if candidate:
+                try:
+                    return get_filename_and_ext(candidate)
+                except NoExtensionFailure:
+                    pass
+        return fallback
 
-    def export(self, album, url):
-        exportFile = "/home/mahaprasad/CyberDrop/" + album + "-data.txt"
-        with open(exportFile, "a") as exportHandle:
-            exportHandle.write(url)
-            exportHandle.write("\n")
+    def is_direct_image(self, url: URL) -> bool:
+        """Checks if the URL points straight at a full size image on a Bunkr CDN"""
+        if not url.host or "thumbs" in url.parts:
+            return False
+        host_parts = url.host.split('.')
+        if len(host_parts) < 2 or not is_stream_cdn(host_parts[0]):
+            return False
+        return url.suffix.lower() in IMAGE_FORMATS
 
-    async def get_album_results(self, album_id):
-        print(f"[GET_ALBUM_RESULTS] Getting album results for: {album_id}")
-        if not album_id:
-            print("[GET_ALBUM_RESULTS] No album ID provided, returning empty results")
-            return []
+    def get_stream_link(self, url: URL) -> URL:
+        host = url.host
+        # Most links are already album, file or download pages, reject those before classifying the host
+        if not host or host.startswith(PAGE_HOST_PREFIXES):
+            return url
             
-        try:
-            results = []
-            return results
-        except Exception as e:
-            print(f"[GET_ALBUM_RESULTS] Error: {str(e)}")
-            print(f"Error getting album results: {str(e)}")
-            return []
+        head, dot, _ = host.partition('.')
+        if not dot or not is_stream_cdn(head):
+            return url
 
-    async def check_album_results(self, url, results):
-        print(f"[CHECK_ALBUM_RESULTS] Checking if URL already exists: {url}")
-        try:
-            return False
-        except Exception as e:
-            print(f"[CHECK_ALBUM_RESULTS] Error: {str(e)}")
-            print(f"Error checking album results: {str(e)}")
-            return False
+        # Same rules as URL.name and URL.suffix, read straight off the path
+        name = url.path.rpartition('/')[2]
+        ext_start = name.rfind('.')
+        if not 0 < ext_start < len(name) - 1:
+            return url
+
+        if name[ext_start:].lower() in VIDEO_FORMATS:
+            return self.primary_video_base / name
+        return self.primary_file_base / name
+
+    def parse_datetime(self, date: str) -> int:
+        """Parses an "%H:%M:%S %d/%m/%Y" card date into a timestamp without going through strptime"""
+        time_part, date_part = date.split()
+        hour, minute, second = map(int, time_part.split(':'))
+        day, month, year = map(int, date_part.split('/'))
+        return calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
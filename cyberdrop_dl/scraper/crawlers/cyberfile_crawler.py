@@ -68,7 +68,7 @@ class CyberfileCrawler(Crawler):
                 elif file_id:
                     link = URL(tile.get('dtfullurl'))
                 else:
-                    await log(f"Couldn't find folder or file id for {scrape_item.url} element", 30)
+                    log(f"Couldn't find folder or file id for {scrape_item.url} element", 30)
                     continue
 
                 new_scrape_item = await self.create_scrape_item(scrape_item, link, title, True)
@@ -107,7 +107,7 @@ class CyberfileCrawler(Crawler):
                 elif file_id:
                     link = URL(tile.get('dtfullurl'))
                 else:
-                    await log(f"Couldn't find folder or file id for {scrape_item.url} element", 30)
+                    log(f"Couldn't find folder or file id for {scrape_item.url} element", 30)
                     continue
 
                 new_scrape_item = await self.create_scrape_item(scrape_item, link, title, True)
@@ -147,7 +147,7 @@ class CyberfileCrawler(Crawler):
             ajax_soup = BeautifulSoup(ajax_dict['html'].replace("\\", ""), 'html.parser')
             
         if "albumPasswordModel" in ajax_dict['html']:
-            await log(f"Album is password protected: {scrape_item.url}", 30)
+            log(f"Album is password protected: {scrape_item.url}", 30)
             raise PasswordProtected()
 
         file_menu = ajax_soup.select_one('ul[class="dropdown-menu dropdown-info account-dropdown-resize-menu"] li a')
@@ -158,7 +158,7 @@ class CyberfileCrawler(Crawler):
             else:
                 html_download_text = file_button.get("onclick")
         except AttributeError:
-            await log(f"Couldn't find download button for {scrape_item.url}", 30)
+            log(f"Couldn't find download button for {scrape_item.url}", 30)
             raise ScrapeFailure(422, "Couldn't find download button")
         link = URL(html_download_text.split("'")[1])
 
@@ -168,7 +168,7 @@ class CyberfileCrawler(Crawler):
         uploaded_date = await self.parse_datetime(uploaded_date)
         scrape_item.possible_datetime = uploaded_date
 
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
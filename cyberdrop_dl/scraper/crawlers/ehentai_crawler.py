@@ -34,7 +34,7 @@ class EHentaiCrawler(Crawler):
         elif "s" in scrape_item.url.parts:
             await self.image(scrape_item)
         else:
-            await log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
+            log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Unsupported Link")
 
         await self.scraping_progress.remove_task(task_id)
@@ -76,7 +76,7 @@ class EHentaiCrawler(Crawler):
             soup = await self.client.get_BS4(self.domain, scrape_item.url)
         image = soup.select_one("img[id=img]")
         link = URL(image.get('src'))
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -71,12 +71,12 @@ class EromeCrawler(Crawler):
 
         for image in images:
             link = URL(image['data-src'])
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             if not await self.check_album_results(link, results):
                 await self.handle_file(link, scrape_item, filename, ext)
 
         for video in vidoes:
             link = URL(video['src'])
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             if not await self.check_album_results(link, results):
                 await self.handle_file(link, scrape_item, filename, ext)
@@ -64,7 +64,7 @@ class F95ZoneCrawler(Crawler):
         if self.logged_in:
             await self.forum(scrape_item)
         else:
-            await log("F95Zone login failed. Skipping.", 40)
+            log("F95Zone login failed. Skipping.", 40)
 
         await self.scraping_progress.remove_task(task_id)
 
@@ -172,10 +172,10 @@ class F95ZoneCrawler(Crawler):
                 elif self.attachment_url_part in link.host:
                     await self.handle_internal_links(link, scrape_item)
                 else:
-                    await log(f"Unknown link type: {link}", 30)
+                    log(f"Unknown link type: {link}", 30)
                     continue
             except TypeError:
-                await log(f"Scrape Failed: encountered while handling {link}", 40)
+                log(f"Scrape Failed: encountered while handling {link}", 40)
 
     @error_handling_wrapper
     async def images(self, scrape_item: ScrapeItem, post_content: Tag) -> None:
@@ -206,7 +206,7 @@ class F95ZoneCrawler(Crawler):
             elif self.attachment_url_part in link.host:
                 await self.handle_internal_links(link, scrape_item)
             else:
-                await log(f"Unknown image type: {link}", 30)
+                log(f"Unknown image type: {link}", 30)
                 continue
 
     @error_handling_wrapper
@@ -273,7 +273,7 @@ class F95ZoneCrawler(Crawler):
             elif self.attachment_url_part in link.host:
                 await self.handle_internal_links(link, scrape_item)
             else:
-                await log(f"Unknown image type: {link}", 30)
+                log(f"Unknown image type: {link}", 30)
                 continue
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -281,7 +281,7 @@ class F95ZoneCrawler(Crawler):
     @error_handling_wrapper
     async def handle_internal_links(self, link: URL, scrape_item: ScrapeItem) -> None:
         """Handles internal links"""
-        filename, ext = await get_filename_and_ext(link.name, True)
+        filename, ext = get_filename_and_ext(link.name, True)
         new_scrape_item = await self.create_scrape_item(scrape_item, link, "Attachments", True)
         await self.handle_file(link, new_scrape_item, filename, ext)
 
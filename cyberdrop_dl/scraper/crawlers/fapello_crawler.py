@@ -75,5 +75,5 @@ class FapelloCrawler(Crawler):
 
         for selection in content_tags:
             link = URL(selection.get('src'))
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             await self.handle_file(link, scrape_item, filename, ext)
@@ -100,9 +100,9 @@ class GoFileCrawler(Crawler):
             else:
                 link = URL(content["link"])
             try:
-                filename, ext = await get_filename_and_ext(link.name)
+                filename, ext = get_filename_and_ext(link.name)
             except NoExtensionFailure:
-                await log(f"Scrape Failed: {link} (No File Extension)", 40)
+                log(f"Scrape Failed: {link} (No File Extension)", 40)
                 await self.manager.log_manager.write_scrape_error_log(link, " No File Extension")
                 await self.manager.progress_manager.scrape_stats_progress.add_failure("No File Extension")
                 continue
@@ -30,7 +30,7 @@ class HotPicCrawler(Crawler):
         elif "i" in scrape_item.url.parts:
             await self.image(scrape_item)
         else:
-            await log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
+            log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Unsupported Link")
 
         await self.scraping_progress.remove_task(task_id)
@@ -48,7 +48,7 @@ class HotPicCrawler(Crawler):
         files = soup.select("a[class*=spotlight]")
         for file in files:
             link = URL(file.get("href"))
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             await self.handle_file(link, scrape_item, filename, ext)
 
     @error_handling_wrapper
@@ -61,5 +61,5 @@ class HotPicCrawler(Crawler):
             soup = await self.client.get_BS4(self.domain, scrape_item.url)
 
         link = URL(soup.select_one("img[id*=main-image]").get("src"))
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, scrape_item, filename, ext)
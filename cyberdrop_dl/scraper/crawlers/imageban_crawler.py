@@ -86,7 +86,7 @@ class ImageBanCrawler(Crawler):
             link = URL(image.get("src"))
             date = await self.parse_datetime(f"{(link.parts[2])}-{(link.parts[3])}-{(link.parts[4])}")
             scrape_item.possible_datetime = date
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             await self.handle_file(link, scrape_item, filename, ext)
 
     @error_handling_wrapper
@@ -104,13 +104,13 @@ class ImageBanCrawler(Crawler):
         image = soup.select_one("img[id=img_main]")
         if image:
             link = URL(image.get("src"))
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             await self.handle_file(link, scrape_item, filename, ext)
 
     @error_handling_wrapper
     async def handle_direct(self, scrape_item: ScrapeItem) -> None:
         """Scrapes an image"""
-        filename, ext = await get_filename_and_ext(scrape_item.url.name)
+        filename, ext = get_filename_and_ext(scrape_item.url.name)
         await self.handle_file(scrape_item.url, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
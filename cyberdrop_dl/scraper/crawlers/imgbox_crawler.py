@@ -55,7 +55,7 @@ class ImgBoxCrawler(Crawler):
         images = images.findAll("img")
         for link in images:
             link = URL(link.get('src').replace("thumbs", "images").replace("_b", "_o"))
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             await self.handle_file(link, scrape_item, filename, ext)
 
     @error_handling_wrapper
@@ -68,7 +68,7 @@ class ImgBoxCrawler(Crawler):
             soup = await self.client.get_BS4(self.domain, scrape_item.url)
 
         image = URL(soup.select_one("img[id=img]").get('src'))
-        filename, ext = await get_filename_and_ext(image.name)
+        filename, ext = get_filename_and_ext(image.name)
         await self.handle_file(image, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -42,7 +42,7 @@ class ImgurCrawler(Crawler):
     async def album(self, scrape_item: ScrapeItem) -> None:
         """Scrapes an album"""
         if self.imgur_client_id == "":
-            await log("To scrape imgur content, you need to provide a client id", 30)
+            log("To scrape imgur content, you need to provide a client id", 30)
             raise FailedLoginFailure(status=401, message="No Imgur Client ID provided")
         await self.check_imgur_credits()
 
@@ -66,7 +66,7 @@ class ImgurCrawler(Crawler):
     async def image(self, scrape_item: ScrapeItem) -> None:
         """Scrapes an image"""
         if self.imgur_client_id == "":
-            await log("To scrape imgur content, you need to provide a client id", 30)
+            log("To scrape imgur content, you need to provide a client id", 30)
             raise FailedLoginFailure(status=401, message="No Imgur Client ID provided")
         await self.check_imgur_credits()
 
@@ -82,7 +82,7 @@ class ImgurCrawler(Crawler):
     @error_handling_wrapper
     async def handle_direct(self, scrape_item: ScrapeItem) -> None:
         """Scrapes an image"""
-        filename, ext = await get_filename_and_ext(scrape_item.url.name)
+        filename, ext = get_filename_and_ext(scrape_item.url.name)
         if ext.lower() == ".gifv" or ext.lower() == ".mp4":
             filename = filename.replace(ext, ".mp4")
             ext = ".mp4"
@@ -124,7 +124,7 @@ class JPGChurchCrawler(Crawler):
         date = await self.parse_datetime(date)
         scrape_item.possible_datetime = date
 
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, scrape_item, filename, ext)
 
     @error_handling_wrapper
@@ -136,7 +136,7 @@ class JPGChurchCrawler(Crawler):
             pattern = r"(jpg\.fish/)|(jpg\.fishing/)|(jpg\.church/)|(jpg[1-5]\.su/)"
             scrape_item.url = URL(re.sub(pattern, r'host.church/', str(scrape_item.url)))
             
-        filename, ext = await get_filename_and_ext(scrape_item.url.name)
+        filename, ext = get_filename_and_ext(scrape_item.url.name)
         await self.handle_file(scrape_item.url, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
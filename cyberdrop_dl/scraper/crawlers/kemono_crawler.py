@@ -146,9 +146,9 @@ class KemonoCrawler(Crawler):
     async def handle_direct_link(self, scrape_item: ScrapeItem) -> None:
         """Handles a direct link"""
         try:
-            filename, ext = await get_filename_and_ext(scrape_item.url.query["f"])
+            filename, ext = get_filename_and_ext(scrape_item.url.query["f"])
         except NoExtensionFailure:
-            filename, ext = await get_filename_and_ext(scrape_item.url.name)
+            filename, ext = get_filename_and_ext(scrape_item.url.name)
         await self.handle_file(scrape_item.url, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -76,7 +76,7 @@ class MediaFireCrawler(Crawler):
         date = await self.parse_datetime(soup.select('ul[class=details] li span')[-1].get_text())
         scrape_item.possible_datetime = date
         link = URL(soup.select_one('a[id=downloadButton]').get('href'))
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -65,7 +65,7 @@ class NudoStarCrawler(Crawler):
         if self.logged_in:
             await self.forum(scrape_item)
         else:
-            await log("Nudostar login failed. Skipping.", 40)
+            log("Nudostar login failed. Skipping.", 40)
 
         await self.scraping_progress.remove_task(task_id)
 
@@ -169,10 +169,10 @@ class NudoStarCrawler(Crawler):
                 elif self.attachment_url_part in link.parts:
                     await self.handle_internal_links(link, scrape_item)
                 else:
-                    await log(f"Unknown link type: {link}", 30)
+                    log(f"Unknown link type: {link}", 30)
                     continue
             except TypeError:
-                await log(f"Scrape Failed: encountered while handling {link}", 40)
+                log(f"Scrape Failed: encountered while handling {link}", 40)
 
     @error_handling_wrapper
     async def images(self, scrape_item: ScrapeItem, post_content: Tag) -> None:
@@ -201,7 +201,7 @@ class NudoStarCrawler(Crawler):
             elif self.attachment_url_part in link.parts:
                 await self.handle_internal_links(link, scrape_item)
             else:
-                await log(f"Unknown image type: {link}", 30)
+                log(f"Unknown image type: {link}", 30)
                 continue
 
     @error_handling_wrapper
@@ -271,7 +271,7 @@ class NudoStarCrawler(Crawler):
             elif self.attachment_url_part in link.parts:
                 await self.handle_internal_links(link, scrape_item)
             else:
-                await log(f"Unknown image type: {link}", 30)
+                log(f"Unknown image type: {link}", 30)
                 continue
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -280,6 +280,6 @@ class NudoStarCrawler(Crawler):
     async def handle_internal_links(self, link: URL, scrape_item: ScrapeItem) -> None:
         """Handles internal links"""
         temp_link = URL(str(link)[:-1]) if str(link).endswith("/") else link
-        filename, ext = await get_filename_and_ext(temp_link.name, True)
+        filename, ext = get_filename_and_ext(temp_link.name, True)
         new_scrape_item = await self.create_scrape_item(scrape_item, link, "Attachments", True)
         await self.handle_file(link, new_scrape_item, filename, ext)
@@ -55,5 +55,5 @@ class NudoStarTVCrawler(Crawler):
         content = soup.select('div[class=block-video] a img')
         for image in content:
             link = URL(image.get('src'))
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             await self.handle_file(link, scrape_item, filename, ext)
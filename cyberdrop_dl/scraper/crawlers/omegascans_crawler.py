@@ -75,7 +75,7 @@ class OmegaScansCrawler(Crawler):
             soup = await self.client.get_BS4(self.domain, scrape_item.url)
 
         if "This chapter is premium" in soup.get_text():
-            await log("Scrape Failed: This chapter is premium", 40)
+            log("Scrape Failed: This chapter is premium", 40)
             raise ScrapeFailure(401, "This chapter is premium")
 
         title_parts = soup.select_one("title").get_text().split(" - ")
@@ -108,14 +108,14 @@ class OmegaScansCrawler(Crawler):
                     continue
             link = URL(link)
 
-            filename, ext = await get_filename_and_ext(link.name)
+            filename, ext = get_filename_and_ext(link.name)
             await self.handle_file(link, scrape_item, filename, ext)
 
     @error_handling_wrapper
     async def handle_direct_link(self, scrape_item: ScrapeItem) -> None:
         """Handles a direct link"""
         scrape_item.url = scrape_item.url.with_name(scrape_item.url.name)
-        filename, ext = await get_filename_and_ext(scrape_item.url.name)
+        filename, ext = get_filename_and_ext(scrape_item.url.name)
         await self.handle_file(scrape_item.url, scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -71,7 +71,7 @@ class PimpAndHostCrawler(Crawler):
         date = await self.parse_datetime(date)
 
         new_scrape_item = await self.create_scrape_item(scrape_item, link, "", True, None, date)
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, new_scrape_item, filename, ext)
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -50,10 +50,10 @@ class PixelDrainCrawler(Crawler):
             link = await self.create_download_link(file['id'])
             date = await self.parse_datetime(file['date_upload'].replace("T", " ").split(".")[0].strip("Z"))
             try:
-                filename, ext = await get_filename_and_ext(file['name'])
+                filename, ext = get_filename_and_ext(file['name'])
             except NoExtensionFailure:
                 if "image" or "video" in file["mime_type"]:
-                    filename, ext = await get_filename_and_ext(file['name'] + "." + file["mime_type"].split("/")[-1])
+                    filename, ext = get_filename_and_ext(file['name'] + "." + file["mime_type"].split("/")[-1])
                 else:
                     raise NoExtensionFailure()
             new_scrape_item = await self.create_scrape_item(scrape_item, link, title, True, None, date)
@@ -69,10 +69,10 @@ class PixelDrainCrawler(Crawler):
         link = await self.create_download_link(JSON_Resp['id'])
         date = await self.parse_datetime(JSON_Resp['date_upload'].replace("T", " ").split(".")[0])
         try:
-            filename, ext = await get_filename_and_ext(JSON_Resp['name'])
+            filename, ext = get_filename_and_ext(JSON_Resp['name'])
         except NoExtensionFailure:
             if "image" or "video" in JSON_Resp["mime_type"]:
-                filename, ext = await get_filename_and_ext(JSON_Resp['name'] + "." + JSON_Resp["mime_type"].split("/")[-1])
+                filename, ext = get_filename_and_ext(JSON_Resp['name'] + "." + JSON_Resp["mime_type"].split("/")[-1])
             else:
                 raise NoExtensionFailure()
         new_scrape_item = await self.create_scrape_item(scrape_item, link, "", False, None, date)
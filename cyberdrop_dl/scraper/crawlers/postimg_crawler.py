@@ -27,7 +27,7 @@ class PostImgCrawler(Crawler):
         task_id = await self.scraping_progress.add_task(scrape_item.url)
 
         if "i.postimg.cc" in scrape_item.url.host:
-            filename, ext = await get_filename_and_ext(scrape_item.url.name)
+            filename, ext = get_filename_and_ext(scrape_item.url.name)
             await self.handle_file(scrape_item.url, scrape_item, filename, ext)
         elif "gallery" in scrape_item.url.parts:
             await self.album(scrape_item)
@@ -66,5 +66,5 @@ class PostImgCrawler(Crawler):
             soup = await self.client.get_BS4(self.domain, scrape_item.url)
 
         link = URL(soup.select_one("a[id=download]").get('href').replace("?dl=1", ""))
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, scrape_item, filename, ext)
@@ -31,7 +31,7 @@ class RedditCrawler(Crawler):
         task_id = await self.scraping_progress.add_task(scrape_item.url)
 
         if not self.reddit_personal_use_script or not self.reddit_secret:
-            await log("Reddit API credentials not found. Skipping.", 30)
+            log("Reddit API credentials not found. Skipping.", 30)
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Failed Login")
             await self.scraping_progress.remove_task(task_id)
             return
@@ -50,7 +50,7 @@ class RedditCrawler(Crawler):
             elif "redd.it" in scrape_item.url.host:
                 await self.media(scrape_item, reddit)
             else:
-                await log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
+                log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
                 await self.manager.progress_manager.scrape_stats_progress.add_failure("Unknown")
 
         await self.scraping_progress.remove_task(task_id)
@@ -103,7 +103,7 @@ class RedditCrawler(Crawler):
             media_url = URL(submission.url)
 
         if "v.redd.it" in media_url.host:
-            filename, ext = await get_filename_and_ext(media_url.name)
+            filename, ext = get_filename_and_ext(media_url.name)
 
         if "redd.it" in media_url.host:
             new_scrape_item = await self.create_new_scrape_item(media_url, scrape_item, title, date)
@@ -130,7 +130,7 @@ class RedditCrawler(Crawler):
     async def media(self, scrape_item: ScrapeItem, reddit: asyncpraw.Reddit) -> None:
         """Handles media links"""
         try:
-            filename, ext = await get_filename_and_ext(scrape_item.url.name)
+            filename, ext = get_filename_and_ext(scrape_item.url.name)
         except NoExtensionFailure:
             head = await self.client.get_head(self.domain, scrape_item.url)
             head = await self.client.get_head(self.domain, head['location'])
@@ -60,7 +60,7 @@ class RedGifsCrawler(Crawler):
                 except (KeyError, TypeError):
                     link = URL(links["sd"])
 
-                filename, ext = await get_filename_and_ext(link.name)
+                filename, ext = get_filename_and_ext(link.name)
                 new_scrape_item = await self.create_scrape_item(scrape_item, link, title, True, date)
                 await self.handle_file(link, new_scrape_item, filename, ext)
             page += 1
@@ -80,7 +80,7 @@ class RedGifsCrawler(Crawler):
 
         link = URL(links["hd"] if "hd" in links else links["sd"])
 
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         new_scrape_item = await self.create_scrape_item(scrape_item, link, title, True, date)
         await self.handle_file(link, new_scrape_item, filename, ext)
 
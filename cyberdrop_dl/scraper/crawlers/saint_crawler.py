@@ -43,5 +43,5 @@ class SaintCrawler(Crawler):
             link = URL(soup.select_one('video[id=main-video] source').get('src'))
         except AttributeError:
             raise ScrapeFailure(404, f"Could not find video source for {scrape_item.url}")
-        filename, ext = await get_filename_and_ext(link.name)
+        filename, ext = get_filename_and_ext(link.name)
         await self.handle_file(link, scrape_item, filename, ext)
@@ -30,7 +30,7 @@ class ScrolllerCrawler(Crawler):
         if "r" in scrape_item.url.parts:
             await self.subreddit(scrape_item)
         else:
-            await log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
+            log(f"Scrape Failed: Unknown URL Path for {scrape_item.url}", 40)
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Unsupported Link")
 
         await self.scraping_progress.remove_task(task_id)
@@ -93,7 +93,7 @@ class ScrolllerCrawler(Crawler):
                     media_sources = [item for item in item['mediaSources'] if ".webp" not in item['url']]
                     if media_sources:
                         highest_res_image_url = URL(media_sources[-1]['url'])
-                        filename, ext = await get_filename_and_ext(highest_res_image_url.name)
+                        filename, ext = get_filename_and_ext(highest_res_image_url.name)
                         await self.handle_file(highest_res_image_url, scrape_item, filename, ext)
 
                 prev_iterator = iterator
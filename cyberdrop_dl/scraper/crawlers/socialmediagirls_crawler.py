@@ -65,7 +65,7 @@ class SocialMediaGirlsCrawler(Crawler):
         if self.logged_in:
             await self.forum(scrape_item)
         else:
-            await log("SocialMediaGirls login failed. Skipping.", 40)
+            log("SocialMediaGirls login failed. Skipping.", 40)
 
         await self.scraping_progress.remove_task(task_id)
 
@@ -175,10 +175,10 @@ class SocialMediaGirlsCrawler(Crawler):
                 elif self.attachment_url_part in link.parts or "smgmedia" in link.host:
                     await self.handle_internal_links(link, scrape_item)
                 else:
-                    await log(f"Unknown link type: {link}", 30)
+                    log(f"Unknown link type: {link}", 30)
                     continue
             except TypeError:
-                await log(f"Scrape Failed: encountered while handling {link}", 40)
+                log(f"Scrape Failed: encountered while handling {link}", 40)
 
     @error_handling_wrapper
     async def images(self, scrape_item: ScrapeItem, post_content: Tag) -> None:
@@ -209,7 +209,7 @@ class SocialMediaGirlsCrawler(Crawler):
             elif self.attachment_url_part in link.parts or "smgmedia" in link.host:
                 await self.handle_internal_links(link, scrape_item)
             else:
-                await log(f"Unknown image type: {link}", 30)
+                log(f"Unknown image type: {link}", 30)
                 continue
 
     @error_handling_wrapper
@@ -285,7 +285,7 @@ class SocialMediaGirlsCrawler(Crawler):
             elif self.attachment_url_part in link.parts or "smgmedia" in link.host:
                 await self.handle_internal_links(link, scrape_item)
             else:
-                await log(f"Unknown image type: {link}", 30)
+                log(f"Unknown image type: {link}", 30)
                 continue
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
@@ -293,7 +293,7 @@ class SocialMediaGirlsCrawler(Crawler):
     @error_handling_wrapper
     async def handle_internal_links(self, link: URL, scrape_item: ScrapeItem) -> None:
         """Handles internal links"""
-        filename, ext = await get_filename_and_ext(link.name, True)
+        filename, ext = get_filename_and_ext(link.name, True)
         new_scrape_item = await self.create_scrape_item(scrape_item, link, "Attachments", True)
         await self.handle_file(link, new_scrape_item, filename, ext)
 
@@ -16,6 +16,8 @@ class TurbovidCrawler(Crawler):
     def __init__(self, manager: Manager):
         super().__init__(manager, "turbovid", "Turbovid")
 
+        self.cookies_set = set()
+
     async def fetch(self, scrape_item: ScrapeItem) -> None:
         """Fetch the turbovid link"""
         task_id = await self.scraping_progress.add_task(scrape_item.url)
@@ -28,29 +30,28 @@ class TurbovidCrawler(Crawler):
         if await self.check_complete_from_referer(scrape_item):
             return
 
+        host = scrape_item.url.host
+        base = f"https://{host}"
         video_id = scrape_item.url.parts[-1]
         if "/embed/" not in scrape_item.url.path:
-            embed_url = scrape_item.url.with_path(f"/embed/{video_id}")
+            embed_url = f"{base}/embed/{video_id}"
         else:
-            embed_url = scrape_item.url
+            embed_url = str(scrape_item.url)
 
         # Dynamically set the API URL based on the incoming domain (turbovid.cr or turbo.cr)
-        api_url = URL(f"https://{scrape_item.url.host}/api/sign")
+        api_url = URL(f"{base}/api/sign")
         
         params = {
             'v': video_id,
         }
         
         headers = {
-            'referer': str(embed_url),
+            'referer': embed_url,
             'x-requested-with': 'XMLHttpRequest',
             'accept': '*/*',
         }
         
-        self.manager.client_manager.cookies.update_cookies(
-            {'captcha_verified': '1'}, 
-            response_url=URL(f"https://{scrape_item.url.host}")
-        )
+        await self.set_cookies(host)
 
         data = await self.client.get_json(
             self.domain, 
@@ -67,6 +68,15 @@ class TurbovidCrawler(Crawler):
         
         # Use filename from API or fallback to ID
         filename_str = data.get("filename") or f"{video_id}.mp4"
-        filename, ext = await get_filename_and_ext(filename_str)
+        filename, ext = get_filename_and_ext(filename_str)
         
-        await self.handle_file(video_link, scrape_item, filename, ext)
\ No newline at end of file
+        await self.handle_file(video_link, scrape_item, filename, ext)
+
+    async def set_cookies(self, host: str) -> None:
+        """Sets the captcha cookie for the given host"""
+        if host in self.cookies_set:
+            return
+
+        self.manager.client_manager.cookies.update_cookies({'captcha_verified': '1'}, response_url=URL(f"https://{host}"))
+
+        self.cookies_set.add(host)
@@ -26,7 +26,7 @@ class XBunkrCrawler(Crawler):
         task_id = await self.scraping_progress.add_task(scrape_item.url)
 
         if "media" in scrape_item.url.host:
-            filename, ext = await get_filename_and_ext(scrape_item.url.name)
+            filename, ext = get_filename_and_ext(scrape_item.url.name)
             await self.handle_file(scrape_item.url, scrape_item, filename, ext)
         else:
             await self.album(scrape_item)
@@ -45,9 +45,9 @@ class XBunkrCrawler(Crawler):
         for link in links:
             link = URL(link.get('href'))
             try:
-                filename, ext = await get_filename_and_ext(link.name)
+                filename, ext = get_filename_and_ext(link.name)
             except NoExtensionFailure:
-                await log(f"Couldn't get extension for {str(link)}", 30)
+                log(f"Couldn't get extension for {str(link)}", 30)
                 continue
             new_scrape_item = await self.create_scrape_item(scrape_item, link, title, True)
             await self.handle_file(link, new_scrape_item, filename, ext)
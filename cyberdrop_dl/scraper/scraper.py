@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import Field
 from pathlib import Path
@@ -12,7 +13,7 @@ from cyberdrop_dl.clients.errors import NoExtensionFailure, JDownloaderFailure
 from cyberdrop_dl.downloader.downloader import Downloader
 from cyberdrop_dl.scraper.jdownloader import JDownloader
 from cyberdrop_dl.utils.dataclasses.url_objects import ScrapeItem, MediaItem
-from cyberdrop_dl.utils.utilities import log, get_filename_and_ext, get_download_path
+from cyberdrop_dl.utils.utilities import log, get_filename_and_ext, get_download_path, MEDIA_FORMATS
 
 if TYPE_CHECKING:
     from typing import List
@@ -45,6 +46,7 @@ class ScrapeMapper:
         self.existing_crawlers = {}
         self.no_crawler_downloader = Downloader(self.manager, "no_crawler")
         self.jdownloader = JDownloader(self.manager)
+        self.map_semaphore = asyncio.Semaphore(50)
 
     async def bunkrr(self) -> None:
         """Creates a Bunkr Crawler instance"""
@@ -326,10 +328,10 @@ class ScrapeMapper:
         links = list(filter(None, links))
 
         if not links:
-            await log("No valid links found.", 30)
+            log("No valid links found.", 30)
         for link in links:
             item = ScrapeItem(url=link, parent_title="")
-            self.manager.task_group.create_task(self.map_url(item))
+            await self.create_map_task(item)
 
     async def load_failed_links(self) -> None:
         """Loads failed links from db"""
@@ -339,19 +341,22 @@ class ScrapeMapper:
             retry_path = Path(item[1])
 
             item = ScrapeItem(link, parent_title="", part_of_album=True, retry=True, retry_path=retry_path)
-            self.manager.task_group.create_task(self.map_url(item))
+            await self.create_map_task(item)
+
+    async def create_map_task(self, scrape_item: ScrapeItem) -> None:
+        """Schedules a link to be mapped once one of the in flight mapping tasks has finished"""
+        await self.map_semaphore.acquire()
+        task = self.manager.task_group.create_task(self.map_url(scrape_item))
+        task.add_done_callback(lambda _: self.map_semaphore.release())
 
     """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
     async def extension_check(self, url: URL) -> bool:
         """Checks if the URL has a valid extension"""
         try:
-            filename, ext = await get_filename_and_ext(url.name)
+            filename, ext = get_filename_and_ext(url.name)
 
-            from cyberdrop_dl.utils.utilities import FILE_FORMATS
-            if ext in FILE_FORMATS['Images'] or ext in FILE_FORMATS['Videos'] or ext in FILE_FORMATS['Audio']:
-                return True
-            return False
+            return ext in MEDIA_FORMATS
         except NoExtensionFailure:
             return False
 
@@ -372,7 +377,7 @@ class ScrapeMapper:
 
         # blocked domains
         if any(x in scrape_item.url.host.lower() for x in ["facebook", "instagram", "fbcdn"]):
-            await log(f"Skipping {scrape_item.url} as it is a blocked domain", 10)
+            log(f"Skipping {scrape_item.url} as it is a blocked domain", 10)
             return
 
         skip = False
@@ -403,30 +408,30 @@ class ScrapeMapper:
             return
 
         elif skip:
-            await log(f"Skipping URL by Config Selections: {scrape_item.url}", 10)
+            log(f"Skipping URL by Config Selections: {scrape_item.url}", 10)
 
         elif await self.extension_check(scrape_item.url):
             check_complete = await self.manager.db_manager.history_table.check_complete("no_crawler", scrape_item.url, scrape_item.url)
             if check_complete:
-                await log(f"Skipping {scrape_item.url} as it has already been downloaded", 10)
+                log(f"Skipping {scrape_item.url} as it has already been downloaded", 10)
                 await self.manager.progress_manager.download_progress.add_previously_completed()
                 return
             await scrape_item.add_to_parent_title("Loose Files")
             scrape_item.part_of_album = True
-            download_folder = await get_download_path(self.manager, scrape_item, "no_crawler")
-            filename, ext = await get_filename_and_ext(scrape_item.url.name)
+            download_folder = get_download_path(self.manager, scrape_item, "no_crawler")
+            filename, ext = get_filename_and_ext(scrape_item.url.name)
             media_item = MediaItem(scrape_item.url, scrape_item.url, None, download_folder, filename, ext, filename)
             self.manager.task_group.create_task(self.no_crawler_downloader.run(media_item))
 
         elif self.jdownloader.enabled:
-            await log(f"Sending unsupported URL to JDownloader: {scrape_item.url}", 10)
+            log(f"Sending unsupported URL to JDownloader: {scrape_item.url}", 10)
             try:
                 await self.jdownloader.direct_unsupported_to_jdownloader(scrape_item.url, scrape_item.parent_title)
             except JDownloaderFailure as e:
-                await log(f"Failed to send {scrape_item.url} to JDownloader", 40)
-                await log(e.message, 40)
+                log(f"Failed to send {scrape_item.url} to JDownloader", 40)
+                log(e.message, 40)
                 await self.manager.log_manager.write_unsupported_urls_log(scrape_item.url)
 
         else:
-            await log(f"Unsupported URL: {scrape_item.url}", 30)
+            log(f"Unsupported URL: {scrape_item.url}", 30)
             await self.manager.log_manager.write_unsupported_urls_log(scrape_item.url)
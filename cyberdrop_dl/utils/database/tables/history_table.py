@@ -76,6 +76,17 @@ class HistoryTable:
         result = await result.fetchall()
         return {row[0]: row[1] for row in result}
     
+    async def check_album_by_referer(self, domain: str, album_id: str) -> set[str]:
+        """Returns the referers of every completed file in an album given its domain and album id"""
+        if self.ignore_history:
+            return set()
+
+        domain = await get_db_domain(domain)
+        cursor = await self.db_conn.cursor()
+        result = await cursor.execute("""SELECT referer FROM media WHERE domain = ? and album_id = ? and completed != 0""", (domain, album_id))
+        result = await result.fetchall()
+        return {row[0] for row in result}
+
     async def set_album_id(self, domain: str, media_item: MediaItem) -> None:
         """Sets an album_id in the database"""
         domain = await get_db_domain(domain)
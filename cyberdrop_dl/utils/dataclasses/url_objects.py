@@ -45,5 +45,5 @@ class ScrapeItem:
         """Adds a title to the parent title"""
         if not title or self.retry:
             return
-        title = await sanitize_folder(title)
+        title = sanitize_folder(title)
         self.parent_title = (self.parent_title + "/" + title) if self.parent_title else title
@@ -9,7 +9,7 @@ import PIL
 from PIL import Image
 from videoprops import get_audio_properties, get_video_properties
 
-from cyberdrop_dl.utils.utilities import FILE_FORMATS, log_with_color, purge_dir
+from cyberdrop_dl.utils.utilities import EXT_TO_CATEGORY, log_with_color, purge_dir
 
 if TYPE_CHECKING:
     from cyberdrop_dl.managers.manager import Manager
@@ -66,19 +66,19 @@ class Sorter:
     async def check_dir_parents(self) -> bool:
         """Checks if the sort dir is in the download dir"""
         if self.download_dir in self.sorted_downloads.parents:
-            await log_with_color("Sort Directory cannot be in the Download Directory", "red", 40)
+            log_with_color("Sort Directory cannot be in the Download Directory", "red", 40)
             return True
         return False
 
     async def sort(self) -> None:
         """Sorts the files in the download directory into their respective folders"""
-        await log_with_color("\nSorting Downloads: Please Wait", "cyan", 20)
+        log_with_color("\nSorting Downloads: Please Wait", "cyan", 20)
 
         if await self.check_dir_parents():
             return
         
         if not self.download_dir.is_dir():
-            await log_with_color("Download Directory does not exist", "red", 40)
+            log_with_color("Download Directory does not exist", "red", 40)
             return
 
         for folder in self.download_dir.iterdir():
@@ -91,22 +91,23 @@ class Sorter:
                 if '.part' in ext:
                     continue
 
-                if ext in FILE_FORMATS['Audio']:
+                category = EXT_TO_CATEGORY.get(ext)
+                if category == 'Audio':
                     await self.sort_audio(file, folder.name)
-                elif ext in FILE_FORMATS['Images']:
+                elif category == 'Images':
                     await self.sort_image(file, folder.name)
-                elif ext in FILE_FORMATS['Videos']:
+                elif category == 'Videos':
                     await self.sort_video(file, folder.name)
                 else:
                     await self.sort_other(file, folder.name)
 
         await asyncio.sleep(5)
-        await purge_dir(self.download_dir)
+        await asyncio.to_thread(purge_dir, self.download_dir)
 
-        await log_with_color(f"Organized: {self.audio_count} Audio Files", "green", 20)
-        await log_with_color(f"Organized: {self.image_count} Image Files", "green", 20)
-        await log_with_color(f"Organized: {self.video_count} Video Files", "green", 20)
-        await log_with_color(f"Organized: {self.other_count} Other Files", "green", 20)
+        log_with_color(f"Organized: {self.audio_count} Audio Files", "green", 20)
+        log_with_color(f"Organized: {self.image_count} Image Files", "green", 20)
+        log_with_color(f"Organized: {self.video_count} Video Files", "green", 20)
+        log_with_color(f"Organized: {self.other_count} Other Files", "green", 20)
 
     async def sort_audio(self, file: Path, base_name: str) -> None:
         """Sorts an audio file into the sorted audio folder"""
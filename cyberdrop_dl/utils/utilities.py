@@ -4,13 +4,16 @@ import asyncio
 import logging
 import os
 import re
+import time
 import traceback
 from enum import IntEnum
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import aiohttp
 import rich
+from rich.text import Text
 from yarl import URL
 
 from cyberdrop_dl.clients.errors import NoExtensionFailure, FailedLoginFailure, InvalidContentTypeFailure, \
@@ -24,33 +27,47 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("cyberdrop_dl")
 logger_debug = logging.getLogger("cyberdrop_dl_debug")
+CONSOLE = rich.get_console()
 
 MAX_NAME_LENGTHS = {"FILE": 95, "FOLDER": 60}
+LOG_BUFFER_SIZE = 65536
+LOG_FLUSH_INTERVAL = 1
+MB = 1024 * 1024
+PROGRESS_BAR_LENGTH = 20
+PROGRESS_BARS = ['█' * i + '░' * (PROGRESS_BAR_LENGTH - i) for i in range(PROGRESS_BAR_LENGTH + 1)]
 
 DEBUG_VAR = False
 
+ILLEGAL_CHARACTERS_TABLE = str.maketrans("", "", '<>:"/\\|?*\'')
+ILLEGAL_FOLDER_CHARACTERS_TABLE = str.maketrans(dict.fromkeys('\\*?:"<>|/', "-"))
+MULTIPLE_SPACES_PATTERN = re.compile(' +')
+MULTIPLE_DOTS_PATTERN = re.compile(r'\.{2,}')
+VERSION_NUMBER_PATTERN = re.compile(r'\d+')
+
 FILE_FORMATS = {
-    'Images': {
+    'Images': frozenset({
         '.jpg', '.jpeg', '.png', '.gif',
         '.gifv', '.webp', '.jpe', '.svg',
         '.jfif', '.tif', '.tiff', '.jif',
-    },
-    'Videos': {
+    }),
+    'Videos': frozenset({
         '.mpeg', '.avchd', '.webm', '.mpv',
         '.swf', '.avi', '.m4p', '.wmv',
         '.mp2', '.m4v', '.qt', '.mpe',
         '.mp4', '.flv', '.mov', '.mpg',
         '.ogg', '.mkv', '.mts', '.ts',
         '.f4v'
-    },
-    'Audio': {
+    }),
+    'Audio': frozenset({
         '.mp3', '.flac', '.wav', '.m4a',
-    },
-    'Text': {
+    }),
+    'Text': frozenset({
         '.htm', '.html', '.md', '.nfo',
         '.txt',
-    }
+    })
 }
+MEDIA_FORMATS = FILE_FORMATS['Images'] | FILE_FORMATS['Videos'] | FILE_FORMATS['Audio']
+EXT_TO_CATEGORY = {ext: category for category, exts in FILE_FORMATS.items() for ext in exts}
 
 
 def error_handling_wrapper(func):
@@ -62,71 +79,81 @@ def error_handling_wrapper(func):
         try:
             return await func(self, *args, **kwargs)
         except NoExtensionFailure:
-            await log(f"Scrape Failed: {link} (No File Extension)", 40)
+            log(f"Scrape Failed: {link} (No File Extension)", 40)
             await self.manager.log_manager.write_scrape_error_log(link, " No File Extension")
             await self.manager.progress_manager.scrape_stats_progress.add_failure("No File Extension")
         except PasswordProtected:
-            await log(f"Scrape Failed: {link} (Password Protected)", 40)
+            log(f"Scrape Failed: {link} (Password Protected)", 40)
             await self.manager.log_manager.write_unsupported_urls_log(link)
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Password Protected")
         except FailedLoginFailure:
-            await log(f"Scrape Failed: {link} (Failed Login)", 40)
+            log(f"Scrape Failed: {link} (Failed Login)", 40)
             await self.manager.log_manager.write_scrape_error_log(link, " Failed Login")
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Failed Login")
         except InvalidContentTypeFailure:
-            await log(f"Scrape Failed: {link} (Invalid Content Type Received)", 40)
+            log(f"Scrape Failed: {link} (Invalid Content Type Received)", 40)
             await self.manager.log_manager.write_scrape_error_log(link, " Invalid Content Type Received")
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Invalid Content Type")
         except asyncio.TimeoutError:
-            await log(f"Scrape Failed: {link} (Timeout)", 40)
+            log(f"Scrape Failed: {link} (Timeout)", 40)
             await self.manager.log_manager.write_scrape_error_log(link, " Timeout")
             await self.manager.progress_manager.scrape_stats_progress.add_failure("Timeout")
         except Exception as e:
-            if hasattr(e, 'status'):
-                if hasattr(e, 'message'):
-                    await log(f"Scrape Failed: {link} ({e.status} - {e.message})", 40)
-                    await self.manager.log_manager.write_scrape_error_log(link, f" {e.status} - {e.message}")
+            status = getattr(e, 'status', None)
+            message = getattr(e, 'message', None)
+            if status is not None:
+                if message is not None:
+                    log(f"Scrape Failed: {link} ({status} - {message})", 40)
+                    await self.manager.log_manager.write_scrape_error_log(link, f" {status} - {message}")
                 else:
-                    await log(f"Scrape Failed: {link} ({e.status})", 40)
-                    await self.manager.log_manager.write_scrape_error_log(link, f" {e.status}")
-                await self.manager.progress_manager.scrape_stats_progress.add_failure(e.status)
+                    log(f"Scrape Failed: {link} ({status})", 40)
+                    await self.manager.log_manager.write_scrape_error_log(link, f" {status}")
+                await self.manager.progress_manager.scrape_stats_progress.add_failure(status)
             else:
-                await log(f"Scrape Failed: {link} ({e})", 40)
-                await log(traceback.format_exc(), 40)
+                log(f"Scrape Failed: {link} ({e})", 40)
+                log(traceback.format_exc(), 40)
                 await self.manager.log_manager.write_scrape_error_log(link, " See Log for Details")
                 await self.manager.progress_manager.scrape_stats_progress.add_failure("Unknown")
     return wrapper
 
 
-async def log(message: [str, Exception], level: int) -> None:
+def log(message: [str, Exception], level: int) -> None:
     """Simple logging function"""
     logger.log(level, message)
     if DEBUG_VAR:
         logger_debug.log(level, message)
 
 
-async def log_debug(message: [str, Exception], level: int) -> None:
-    """Simple logging function"""
-    if DEBUG_VAR:
-        logger_debug.log(level, message.encode('ascii', 'ignore').decode('ascii'))
+def log_debug(message: str, level: int, *args) -> None:
+    """Simple debug logging function, message is %-formatted with args only if the debug log is enabled"""
+    if not DEBUG_VAR or not logger_debug.isEnabledFor(level):
+        return
+    if args:
+        message = message % args
+    logger_debug.log(level, message.encode('ascii', 'ignore').decode('ascii'))
 
 
-async def log_with_color(message: str, style: str, level: int) -> None:
+def log_with_color(message: str, style: str, level: int) -> None:
     """Simple logging function with color"""
     logger.log(level, message)
     if DEBUG_VAR:
         logger_debug.log(level, message)
-    rich.print(f"[{style}]{message}[/{style}]")
+    CONSOLE.print(Text(message, style=style))
 
 
-async def print_download_progress(manager: 'Manager') -> None:
-    """Periodically prints download progress information to the console when using --no-ui option"""
+async def print_download_progress(manager: 'Manager') -> bool:
+    """Prints download progress for the --no-ui option if the counters changed, returns whether it printed"""
     try:
         total_files = manager.progress_manager.download_progress.total_files
         completed = manager.progress_manager.download_progress.completed_files
         previously_completed = manager.progress_manager.download_progress.previously_completed_files
         skipped = manager.progress_manager.download_progress.skipped_files
         failed = manager.progress_manager.download_progress.failed_files
+
+        state = (total_files, completed, previously_completed, skipped, failed)
+        if state == manager.last_progress_state:
+            return False
+        manager.last_progress_state = state
         
         in_progress = total_files - (completed + previously_completed + skipped + failed)
         
@@ -134,23 +161,28 @@ async def print_download_progress(manager: 'Manager') -> None:
         if total_files > 0:
             progress_percentage = ((completed + previously_completed + skipped) / total_files) * 100 if total_files > 0 else 0
             
-            await log_with_color(
+            log_with_color(
                 f"Progress: [{completed + previously_completed + skipped}/{total_files}] {progress_percentage:.2f}% - "
                 f"Completed: {completed}, Previously: {previously_completed}, Skipped: {skipped}, Failed: {failed}, In Progress: {in_progress}",
                 "cyan", 20
             )
+            return True
     except Exception as e:
-        await log(f"Error printing progress: {e}", 40)
+        log(f"Error printing progress: {e}", 40)
+    return False
 
 
-async def print_file_progress(manager: 'Manager') -> None:
-    """Prints information about currently downloading files"""
+async def print_file_progress(manager: 'Manager') -> bool:
+    """Prints the currently downloading files if they changed, returns whether it printed"""
     try:
         # Get active download tasks
         active_tasks = []
-        for task_id in manager.progress_manager.file_progress.visible_tasks + manager.progress_manager.file_progress.invisible_tasks:
-            if task_id not in manager.progress_manager.file_progress.completed_tasks:
-                task = manager.progress_manager.file_progress.progress.tasks[task_id]
+        file_progress = manager.progress_manager.file_progress
+        tasks = file_progress.progress.tasks
+        completed_tasks = set(file_progress.completed_tasks)
+        for task_id in file_progress.visible_tasks + file_progress.invisible_tasks:
+            if task_id not in completed_tasks:
+                task = tasks[task_id]
                 if task.total > 0:  # Only include tasks with a known total size
                     percentage = (task.completed / task.total) * 100 if task.total > 0 else 0
                     speed = task.speed if hasattr(task, 'speed') else "N/A"
@@ -162,32 +194,62 @@ async def print_file_progress(manager: 'Manager') -> None:
                         "speed": speed
                     })
         
+        state = tuple((task["description"], task["completed"], task["total"]) for task in active_tasks)
+        if state == manager.last_file_progress_state:
+            return False
+        manager.last_file_progress_state = state
+
         # Print information about active downloads (limit to 3 to avoid flooding the console)
         if active_tasks:
-            await log_with_color("Currently downloading:", "yellow", 20)
+            log_with_color("Currently downloading:", "yellow", 20)
             for i, task in enumerate(active_tasks[:3]):  # Limit to 3 files
-                completed_mb = task["completed"] / (1024 * 1024)
-                total_mb = task["total"] / (1024 * 1024)
+                completed_mb = task["completed"] / MB
+                total_mb = task["total"] / MB
                 
-                # Create a simple text-based progress bar
-                bar_length = 20
-                filled_length = int(bar_length * task["percentage"] / 100)
-                bar = '█' * filled_length + '░' * (bar_length - filled_length)
+                # Pick the matching text-based progress bar
+                filled_length = min(int(PROGRESS_BAR_LENGTH * task["percentage"] / 100), PROGRESS_BAR_LENGTH)
+                bar = PROGRESS_BARS[filled_length]
                 
-                await log_with_color(
+                log_with_color(
                     f"  {task['description']}: {bar} {completed_mb:.2f}MB / {total_mb:.2f}MB ({task['percentage']:.2f}%)",
                     "yellow", 20
                 )
             
             if len(active_tasks) > 3:
-                await log_with_color(f"  ... and {len(active_tasks) - 3} more files", "yellow", 20)
+                log_with_color(f"  ... and {len(active_tasks) - 3} more files", "yellow", 20)
+            return True
     except Exception as e:
-        await log(f"Error printing file progress: {e}", 40)
+        log(f"Error printing file progress: {e}", 40)
+    return False
 
 
 """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches writes in a 64KB buffer, flushing on warnings and errors or once a second"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE, encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if record.levelno >= logging.WARNING or now - self._last_flush >= LOG_FLUSH_INTERVAL:
+                self.stream.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class CustomHTTPStatus(IntEnum):
     WEB_SERVER_IS_DOWN = 521
     IM_A_TEAPOT = 418
@@ -197,83 +259,88 @@ class CustomHTTPStatus(IntEnum):
 """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
 
-async def sanitize(name: str) -> str:
+def sanitize(name: str) -> str:
     """Simple sanitization to remove illegal characters"""
-    return re.sub(r'[<>:"/\\|?*\']', "", name).strip()
+    return name.translate(ILLEGAL_CHARACTERS_TABLE).strip()
 
 
-async def sanitize_folder(title: str) -> str:
+def sanitize_folder(title: str) -> str:
     """Simple sanitization to remove illegal characters from titles and trim the length to be less than 60 chars"""
+    return _sanitize_folder(title, MAX_NAME_LENGTHS['FOLDER'])
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_folder(title: str, max_length: int) -> str:
+    """Cached implementation of sanitize_folder"""
     title = title.replace("\n", "").strip()
     title = title.replace("\t", "").strip()
-    title = re.sub(' +', ' ', title)
-    title = re.sub(r'[\\*?:"<>|/]', "-", title)
-    title = re.sub(r'\.{2,}', ".", title)
+    title = MULTIPLE_SPACES_PATTERN.sub(' ', title)
+    title = title.translate(ILLEGAL_FOLDER_CHARACTERS_TABLE)
+    title = MULTIPLE_DOTS_PATTERN.sub(".", title)
     title = title.rstrip(".").strip()
 
     if "(" in title and ")" in title:
         new_title = title.rsplit("(")[0].strip()
-        new_title = new_title[:MAX_NAME_LENGTHS['FOLDER']].strip()
+        new_title = new_title[:max_length].strip()
         domain_part = title.rsplit("(")[1].strip()
         title = f"{new_title} ({domain_part}"
     else:
-        title = title[:MAX_NAME_LENGTHS['FOLDER']].strip()
+        title = title[:max_length].strip()
     return title
 
 
-async def get_filename_and_ext(filename: str, forum: bool = False) -> Tuple[str, str]:
+def get_filename_and_ext(filename: str, forum: bool = False) -> Tuple[str, str]:
     """Returns the filename and extension of a given file, throws NoExtensionFailure if there is no extension"""
-    print(f"[GET_FILENAME_EXT] Starting with filename: '{filename}'")
+    return _get_filename_and_ext(filename, forum, MAX_NAME_LENGTHS['FILE'])
+
+
+@lru_cache(maxsize=4096)
+def _get_filename_and_ext(filename: str, forum: bool, max_length: int) -> Tuple[str, str]:
+    """Cached implementation of get_filename_and_ext"""
     if not filename:
-        print(f"[GET_FILENAME_EXT] Empty filename provided")
         raise NoExtensionFailure()
-    
-    filename_parts = filename.rsplit('.', 1)
-    print(f"[GET_FILENAME_EXT] Filename parts after splitting on last dot: {filename_parts}")
-    if len(filename_parts) == 1:
-        print(f"[GET_FILENAME_EXT] No extension found in filename (no dot)")
+
+    head, sep, ext_part = filename.rpartition('.')
+    if not sep:
         raise NoExtensionFailure()
-    if filename_parts[-1].isnumeric() and forum:
-        print(f"[GET_FILENAME_EXT] Forum mode and numeric extension, trying to split on last dash")
-        filename_parts = filename_parts[0].rsplit('-', 1)
-        print(f"[GET_FILENAME_EXT] New filename parts: {filename_parts}")
-    if len(filename_parts[-1]) > 5:
-        print(f"[GET_FILENAME_EXT] Extension too long (> 5 chars): {filename_parts[-1]}")
+    if ext_part.isnumeric() and forum:
+        head, sep, ext_part = head.rpartition('-')
+        if not sep:
+            raise NoExtensionFailure()
+    if len(ext_part) > 5:
         raise NoExtensionFailure()
-    ext = "." + filename_parts[-1].lower()
-    print(f"[GET_FILENAME_EXT] Extension: {ext}")
-    filename = filename_parts[0][:MAX_NAME_LENGTHS['FILE']] if len(filename_parts[0]) > MAX_NAME_LENGTHS['FILE'] else filename_parts[0]
-    filename = filename.strip()
-    filename = filename.rstrip(".")
-    print(f"[GET_FILENAME_EXT] Base filename after processing: {filename}")
-    filename = await sanitize(filename + ext)
-    print(f"[GET_FILENAME_EXT] Sanitized final result: {filename}, extension: {ext}")
-    return filename, ext
-
-
-async def get_download_path(manager: Manager, scrape_item: ScrapeItem, domain: str) -> Path:
-    """Returns the path to the download folder"""
-    download_dir = manager.path_manager.download_dir
+    ext = "." + ext_part.lower()
+    filename = head.translate(ILLEGAL_CHARACTERS_TABLE)[:max_length].strip().rstrip(".")
+    return filename + ext.translate(ILLEGAL_CHARACTERS_TABLE).rstrip(), ext
 
+
+def get_download_path(manager: Manager, scrape_item: ScrapeItem, domain: str) -> Path:
+    """Returns the path to the download folder"""
     if scrape_item.retry:
         return scrape_item.retry_path
+    return _get_download_path(manager.path_manager.download_dir, scrape_item.parent_title,
+                              bool(scrape_item.part_of_album), domain)
+
 
-    if scrape_item.parent_title and scrape_item.part_of_album:
-        return download_dir / scrape_item.parent_title
-    elif scrape_item.parent_title:
-        return download_dir / scrape_item.parent_title / f"Loose Files ({domain})"
+@lru_cache(maxsize=512)
+def _get_download_path(download_dir: Path, parent_title: str, part_of_album: bool, domain: str) -> Path:
+    """Cached implementation of get_download_path"""
+    if parent_title and part_of_album:
+        return download_dir / parent_title
+    elif parent_title:
+        return download_dir / parent_title / f"Loose Files ({domain})"
     else:
         return download_dir / f"Loose Files ({domain})"
 
 
-async def remove_id(manager: Manager, filename: str, ext: str) -> Tuple[str, str]:
+def remove_id(manager: Manager, filename: str, ext: str) -> Tuple[str, str]:
     """Removes the additional string some websites adds to the end of every filename"""
     original_filename = filename
     if manager.config_manager.settings_data["Download_Options"]["remove_generated_id_from_filenames"]:
-        original_filename = filename
-        filename = filename.rsplit(ext, 1)[0]
-        filename = filename.rsplit("-", 1)[0]
-        if ext not in filename:
+        stem = filename[:-len(ext)] if filename.endswith(ext) else filename
+        dash = stem.rfind("-")
+        filename = stem[:dash] if dash != -1 else stem
+        if not filename.endswith(ext):
             filename = filename + ext
     return original_filename, filename
 
@@ -281,55 +348,86 @@ async def remove_id(manager: Manager, filename: str, ext: str) -> Tuple[str, str
 """~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"""
 
 
-async def purge_dir(dirname: Path) -> None:
-    """Purges empty directories"""
-    deleted = []
-    dir_tree = list(os.walk(dirname, topdown=False))
+def purge_dir(dirname: Path | str) -> bool:
+    """Purges empty directories, returns whether the given directory was removed"""
+    try:
+        with os.scandir(dirname) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return False
+
+    keep = False
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False) or not purge_dir(entry.path):
+            keep = True
+    if keep:
+        return False
 
-    for tree_element in dir_tree:
-        sub_dir = tree_element[0]
-        dir_count = len(os.listdir(sub_dir))
-        if dir_count == 0:
-            deleted.append(sub_dir)
-    list(map(os.rmdir, deleted))
+    try:
+        os.rmdir(dirname)
+    except OSError:
+        return False
+    return True
+
+
+def scan_partial_downloads(dirname: Path, delete: bool) -> bool:
+    """Walks the directory once looking for partial downloads, deleting them if asked, returns whether any were found"""
+    found = False
+    for dirpath, _, filenames in os.walk(dirname):
+        for name in filenames:
+            if not name.endswith(".part"):
+                continue
+            if not delete:
+                return True
+            found = True
+            Path(dirpath, name).unlink(missing_ok=True)
+    return found
 
 
 async def check_partials_and_empty_folders(manager: Manager):
     """Checks for partial downloads and empty folders"""
     if manager.config_manager.settings_data['Runtime_Options']['delete_partial_files']:
-        await log_with_color("Deleting partial downloads...", "bold_red", 20)
-        partial_downloads = manager.path_manager.download_dir.rglob("*.part")
-        for file in partial_downloads:
-            file.unlink(missing_ok=True)
+        log_with_color("Deleting partial downloads...", "bold_red", 20)
+        await asyncio.to_thread(scan_partial_downloads, manager.path_manager.download_dir, True)
     elif not manager.config_manager.settings_data['Runtime_Options']['skip_check_for_partial_files']:
-        await log_with_color("Checking for partial downloads...", "yellow", 20)
-        partial_downloads = any(f.is_file() for f in manager.path_manager.download_dir.rglob("*.part"))
+        log_with_color("Checking for partial downloads...", "yellow", 20)
+        partial_downloads = await asyncio.to_thread(scan_partial_downloads, manager.path_manager.download_dir, False)
         if partial_downloads:
-            await log_with_color("There are partial downloads in the downloads folder", "yellow", 20)
-        temp_downloads = any(Path(f).is_file() for f in await manager.db_manager.temp_table.get_temp_names())
+            log_with_color("There are partial downloads in the downloads folder", "yellow", 20)
+        temp_names = await manager.db_manager.temp_table.get_temp_names()
+        temp_downloads = await asyncio.to_thread(lambda: any(Path(f).is_file() for f in temp_names))
         if temp_downloads:
-            await log_with_color("There are partial downloads from the previous run, please re-run the program.", "yellow", 20)
+            log_with_color("There are partial downloads from the previous run, please re-run the program.", "yellow", 20)
 
     if not manager.config_manager.settings_data['Runtime_Options']['skip_check_for_empty_folders']:
-        await log_with_color("Checking for empty folders...", "yellow", 20)
-        await purge_dir(manager.path_manager.download_dir)
+        log_with_color("Checking for empty folders...", "yellow", 20)
+        await asyncio.to_thread(purge_dir, manager.path_manager.download_dir)
         if isinstance(manager.path_manager.sorted_dir, Path):
-            await purge_dir(manager.path_manager.sorted_dir)
+            await asyncio.to_thread(purge_dir, manager.path_manager.sorted_dir)
+
+
+def get_version_tuple(version: str) -> Tuple[int, ...]:
+    """Returns the numeric parts of a version string so versions compare numerically"""
+    return tuple(int(part) for part in VERSION_NUMBER_PATTERN.findall(version))
 
 
 async def check_latest_pypi():
     """Checks if the current version is the latest version"""
     from cyberdrop_dl import __version__ as current_version
-    import json
-    import urllib.request
 
     # retrieve info on latest version
-    contents = urllib.request.urlopen('https://pypi.org/pypi/cyberdrop-dl/json').read()
-    data = json.loads(contents)
-    latest_version = data['info']['version']
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            async with session.get('https://pypi.org/pypi/cyberdrop-dl/json') as response:
+                response.raise_for_status()
+                data = await response.json()
+        latest_version = data['info']['version']
+    except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, TypeError, ValueError) as e:
+        log(f"Unable to check for updates: {e!r}", 10)
+        return
 
-    if current_version.split(".")[0] > latest_version.split(".")[0]:
+    if get_version_tuple(current_version)[:1] > get_version_tuple(latest_version)[:1]:
         return
 
     if current_version != latest_version:
-        await log_with_color(f"New version of cyberdrop-dl available: {latest_version}", "bold_red", 30)
+        log_with_color(f"New version of cyberdrop-dl available: {latest_version}", "bold_red", 30)